@@ -6,8 +6,9 @@ import asyncio
 import logging
 import secrets
 import time
-from typing import Dict, Optional
-import uuid
+from typing import Dict, Optional, Tuple
+import orjson
+from application import messages
 from domain.models import Game
 from domain.value_objects import GameState, GameMode, PlayerID
 from infrastructure.connection_manager import ConnectionManager
@@ -24,6 +25,7 @@ _FINISHED_GAME_TTL = 30 * 60       # 30 minutes after finishing
 _WAITING_GAME_TTL = 2 * 60 * 60    # 2 hours if still waiting
 _DISCONNECT_GAME_TTL = 30 * 60     # 30 minutes after a player disconnects
 _CLEANUP_INTERVAL = 5 * 60         # run every 5 minutes
+_SHUTDOWN_DRAIN_TIMEOUT = 5        # seconds to flush queued frames on shutdown
 
 
 class GameService:
@@ -34,6 +36,9 @@ class GameService:
         self._game_store = game_store
         self.games: Dict[str, Game] = {}
         self._game_locks: Dict[str, asyncio.Lock] = {}
+        # Serialised get_game_info_json responses, keyed by game ID and tagged
+        # with the state they were built for.
+        self._info_cache: Dict[str, Tuple[GameState, bytes]] = {}
         self._cleanup_task: Optional[asyncio.Task] = None
 
     def _sync_game_gauges(self) -> None:
@@ -59,13 +64,20 @@ class GameService:
         self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
 
     async def shutdown(self) -> None:
-        """Cancel background tasks and wait for them to finish."""
+        """Cancel background tasks and flush frames still queued for clients."""
         if self._cleanup_task:
             self._cleanup_task.cancel()
             try:
                 await self._cleanup_task
             except asyncio.CancelledError:
                 pass
+        try:
+            await asyncio.wait_for(
+                self.connection_manager.drain(), timeout=_SHUTDOWN_DRAIN_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Shutting down with undelivered WebSocket frames")
+        await self.connection_manager.close()
 
     async def _periodic_cleanup(self) -> None:
         """Periodically evict stale games from memory and Redis."""
@@ -94,8 +106,8 @@ class GameService:
         for game_id in stale_ids:
             del self.games[game_id]
             self._game_locks.pop(game_id, None)
-            if game_id in self.connection_manager.active_connections:
-                del self.connection_manager.active_connections[game_id]
+            self._info_cache.pop(game_id, None)
+            self.connection_manager.remove_game(game_id)
             await self._game_store.delete(game_id)
         if stale_ids:
             GAMES_CLEANED_UP.inc(len(stale_ids))
@@ -109,7 +121,9 @@ class GameService:
 
     async def create_game(self, mode: GameMode = GameMode.CLASSIC) -> str:
         """Create a new game and return its ID"""
-        game_id = str(uuid.uuid4())
+        # 72 random bits in 12 URL-safe chars: unguessable (game IDs grant
+        # the right to join) yet a third the length of a UUID string.
+        game_id = secrets.token_urlsafe(9)
         self.games[game_id] = Game(game_id, mode=mode)
         GAMES_CREATED.labels(mode=mode.value).inc()
         self._sync_game_gauges()
@@ -127,19 +141,33 @@ class GameService:
             self.games[game_id] = game
         return game
 
-    async def get_game_info(self, game_id: str) -> Optional[dict]:
-        """Get game information for API response.
+    async def get_game_info_json(self, game_id: str) -> Optional[bytes]:
+        """Get JSON-encoded game information for the API response.
 
         Only exposes the game state — player slot occupancy is deliberately
         hidden to prevent game-ID enumeration attacks (#18).
 
         For finished games the full (unmasked) boards and winner are included
         so the result can be rendered as a static artifact.
+
+        The info only depends on the game state: id and mode never change,
+        and boards are only included once the game is finished and frozen.
+        The cached bytes are therefore reused until the state moves on.
         """
         game = await self.get_game(game_id)
         if not game:
             return None
 
+        cached = self._info_cache.get(game_id)
+        if cached is not None and cached[0] == game.state:
+            return cached[1]
+
+        payload = orjson.dumps(self._build_game_info(game))
+        self._info_cache[game_id] = (game.state, payload)
+        return payload
+
+    @staticmethod
+    def _build_game_info(game: Game) -> dict:
         info: dict = {
             "id": game.id,
             "state": game.state.value,
@@ -149,7 +177,7 @@ class GameService:
         if game.state == GameState.FINISHED:
             info["winner"] = game.check_winner()
             info["boards"] = {
-                pid: game.boards[pid] for pid in PlayerID.both()
+                pid.value: game.get_board(pid) for pid in PlayerID.both()
             }
 
         return info
@@ -212,7 +240,7 @@ class GameService:
             await self.connection_manager.connect(game_id, player_id, websocket)
 
             # Send player assignment (includes session token for the client to store)
-            await self.connection_manager.send_to_player(game_id, player_id, {
+            self.connection_manager.send_to_player(game_id, player_id, {
                 "type": "player_assigned",
                 "player_id": player_id,
                 "game_state": game.state.value,
@@ -231,13 +259,13 @@ class GameService:
             if send_resumed:
                 opponent = PlayerID(player_id).opponent
                 opponent_board = (
-                    game.boards[opponent]
+                    game.get_board(opponent)
                     if game.state == GameState.FINISHED
                     else game.get_masked_board(player_id)
                 )
-                await self.connection_manager.send_to_player(game_id, player_id, {
+                self.connection_manager.send_to_player(game_id, player_id, {
                     "type": "game_resumed",
-                    "own_board": game.boards[player_id],
+                    "own_board": game.get_board(player_id),
                     "opponent_board": opponent_board,
                     "current_turn": game.current_turn,
                     "game_state": game.state.value,
@@ -247,17 +275,14 @@ class GameService:
 
             # Notify both players if game is ready for placement
             if game.state == GameState.PLACING:
-                await self.connection_manager.broadcast_to_game(game_id, {
-                    "type": "game_ready",
-                    "message": f"Both players connected. Place your planes! ({game.mode.plane_count} planes each)"
-                })
+                self.connection_manager.broadcast_to_game(game_id, messages.GAME_READY[game.mode])
 
             # Notify opponent that this player has (re)connected.
             # Sent on reconnection (token present) AND when a new player
             # joins a continued game that's already in PLAYING/FINISHED.
             if token or game.state in (GameState.PLAYING, GameState.FINISHED):
                 opponent = PlayerID(player_id).opponent
-                await self.connection_manager.send_to_player(game_id, opponent, {
+                self.connection_manager.send_to_player(game_id, opponent, {
                     "type": "player_reconnected",
                     "player_id": player_id,
                 })
@@ -272,23 +297,17 @@ class GameService:
             return
 
         if game.state != GameState.PLACING:
-            await self.connection_manager.send_to_player(game_id, player_id, {
-                "type": "error",
-                "message": "Game is not in placement phase",
-            })
+            self.connection_manager.send_to_player(game_id, player_id, messages.NOT_PLACING)
             return
 
         opponent = PlayerID(player_id).opponent
         if game.players[opponent] is None:
-            await self.connection_manager.send_to_player(game_id, player_id, {
-                "type": "error",
-                "message": "Opponent is disconnected"
-            })
+            self.connection_manager.send_to_player(game_id, player_id, messages.OPPONENT_DISCONNECTED)
             return
 
         success, message = game.place_plane(player_id, plane_data)
         
-        await self.connection_manager.send_to_player(game_id, player_id, {
+        self.connection_manager.send_to_player(game_id, player_id, {
             "type": "plane_placed",
             "success": success,
             "message": message,
@@ -303,10 +322,9 @@ class GameService:
             if game.are_both_players_ready():
                 game.start_game()
                 self._sync_game_gauges()
-                await self.connection_manager.broadcast_to_game(game_id, {
-                    "type": "game_started",
-                    "current_turn": game.current_turn
-                })
+                self.connection_manager.broadcast_to_game(
+                    game_id, messages.GAME_STARTED[game.current_turn]
+                )
 
         await self._persist(game_id)
 
@@ -317,78 +335,46 @@ class GameService:
             return
         
         if game.state != GameState.PLAYING:
-            await self.connection_manager.send_to_player(game_id, player_id, {
-                "type": "error",
-                "message": "Game is not in progress",
-            })
+            self.connection_manager.send_to_player(game_id, player_id, messages.NOT_PLAYING)
             return
         
         if game.current_turn != player_id:
-            await self.connection_manager.send_to_player(game_id, player_id, {
-                "type": "error",
-                "message": "Not your turn"
-            })
+            self.connection_manager.send_to_player(game_id, player_id, messages.NOT_YOUR_TURN)
             return
 
         opponent = PlayerID(player_id).opponent
         if game.players[opponent] is None:
-            await self.connection_manager.send_to_player(game_id, player_id, {
-                "type": "error",
-                "message": "Opponent is disconnected"
-            })
+            self.connection_manager.send_to_player(game_id, player_id, messages.OPPONENT_DISCONNECTED)
             return
 
         result = game.attack(player_id, x, y)
         
         if result is None or result == "already_attacked":
-            await self.connection_manager.send_to_player(game_id, player_id, {
-                "type": "attack_result",
-                "success": False,
-                "message": "Invalid attack"
-            })
+            self.connection_manager.send_to_player(game_id, player_id, messages.INVALID_ATTACK)
             return
-        
-        # Send attack result to both players
-        opponent = PlayerID(player_id).opponent
-        
-        await self.connection_manager.send_to_player(game_id, player_id, {
-            "type": "attack_result",
-            "success": True,
-            "result": result,
-            "x": x,
-            "y": y,
-            "is_attacker": True
-        })
-        
-        await self.connection_manager.send_to_player(game_id, opponent, {
-            "type": "attack_result",
-            "success": True,
-            "result": result,
-            "x": x,
-            "y": y,
-            "is_attacker": False
-        })
-        
-        # Check for winner
+
         winner = game.check_winner()
         if winner:
             game.finish_game()
             GAMES_FINISHED.inc()
             self._sync_game_gauges()
-            for pid in PlayerID.both():
-                opponent = pid.opponent
-                await self.connection_manager.send_to_player(game_id, pid, {
-                    "type": "game_over",
-                    "winner": winner,
-                    "opponent_board": game.boards[opponent],
-                })
         else:
-            # Switch turns
             game.switch_turn()
-            await self.connection_manager.broadcast_to_game(game_id, {
-                "type": "turn_changed",
-                "current_turn": game.current_turn
-            })
+
+        # One frame per move for both players: each client derives its own
+        # view from ``attacker``.  On game over both boards are revealed.
+        message = {
+            "type": "attack_resolved",
+            "x": x,
+            "y": y,
+            "result": result,
+            "attacker": player_id,
+            "next_turn": game.current_turn,
+            "winner": winner,
+        }
+        if winner:
+            message["boards"] = {pid.value: game.get_board(pid) for pid in PlayerID.both()}
+        self.connection_manager.broadcast_to_game(game_id, message)
 
         await self._persist(game_id)
 
@@ -401,9 +387,7 @@ class GameService:
         """
         # Guard against stale disconnect clearing a newer connection
         if websocket is not None:
-            current_ws = self.connection_manager.active_connections.get(
-                game_id, {}
-            ).get(player_id)
+            current_ws = self.connection_manager.get_websocket(game_id, player_id)
             if current_ws is not None and current_ws is not websocket:
                 # A new connection already took over — nothing to clean up
                 return
@@ -420,13 +404,13 @@ class GameService:
         # pending rematch so neither player gets stuck waiting.
         if game.state == GameState.FINISHED:
             opponent = PlayerID(player_id).opponent
-            await self.connection_manager.send_to_player(game_id, opponent, {
+            self.connection_manager.send_to_player(game_id, opponent, {
                 "type": "player_disconnected",
                 "player_id": player_id,
             })
             if game.rematch_requested_by and not game.rematch_game_id:
                 game.rematch_requested_by = None
-                await self.connection_manager.send_to_player(game_id, opponent, {
+                self.connection_manager.send_to_player(game_id, opponent, {
                     "type": "rematch_cancelled",
                 })
             await self._persist(game_id)
@@ -435,7 +419,7 @@ class GameService:
         # Clear the player slot so a reconnecting client can reclaim it
         game.players[player_id] = None
 
-        await self.connection_manager.broadcast_to_game(game_id, {
+        self.connection_manager.broadcast_to_game(game_id, {
             "type": "player_disconnected",
             "player_id": player_id
         })
@@ -450,7 +434,7 @@ class GameService:
 
         if game.rematch_game_id:
             # Rematch already created — resend the game ID
-            await self.connection_manager.send_to_player(game_id, player_id, {
+            self.connection_manager.send_to_player(game_id, player_id, {
                 "type": "rematch_started",
                 "game_id": game.rematch_game_id,
             })
@@ -459,13 +443,11 @@ class GameService:
         opponent = PlayerID(player_id).opponent
 
         # If the opponent isn't connected, a rematch isn't possible.
-        opponent_connected = bool(
-            self.connection_manager.active_connections
-            .get(game_id, {})
-            .get(opponent)
+        opponent_connected = (
+            self.connection_manager.get_websocket(game_id, opponent) is not None
         )
         if not opponent_connected:
-            await self.connection_manager.send_to_player(game_id, player_id, {
+            self.connection_manager.send_to_player(game_id, player_id, {
                 "type": "rematch_declined",
                 "reason": "opponent_disconnected",
             })
@@ -476,14 +458,14 @@ class GameService:
             new_game_id = await self.create_game(mode=game.mode)
             game.rematch_game_id = new_game_id
             await self._persist(game_id)
-            await self.connection_manager.broadcast_to_game(game_id, {
+            self.connection_manager.broadcast_to_game(game_id, {
                 "type": "rematch_started",
                 "game_id": new_game_id,
             })
         elif game.rematch_requested_by != player_id:
             game.rematch_requested_by = player_id
             await self._persist(game_id)
-            await self.connection_manager.send_to_player(game_id, opponent, {
+            self.connection_manager.send_to_player(game_id, opponent, {
                 "type": "rematch_requested",
             })
 
@@ -0,0 +1,51 @@
+"""
+Outbound messages that never change, serialised once at import.
+
+ConnectionManager passes pre-encoded strings straight through, so sending
+one of these skips building and dumping a dict on every call.
+"""
+import orjson
+from domain.value_objects import GameMode, PlayerID
+
+
+def _encode(message: dict) -> str:
+    return orjson.dumps(message).decode()
+
+
+def _error(text: str) -> str:
+    return _encode({"type": "error", "message": text})
+
+
+# Gameplay errors
+NOT_PLACING = _error("Game is not in placement phase")
+NOT_PLAYING = _error("Game is not in progress")
+NOT_YOUR_TURN = _error("Not your turn")
+OPPONENT_DISCONNECTED = _error("Opponent is disconnected")
+INVALID_ATTACK = _error("Invalid attack")
+
+# Receive-loop errors
+MESSAGE_TOO_LARGE = _error("Message too large")
+RATE_LIMITED = _error("Too many messages, slow down")
+INVALID_JSON = _error("Invalid JSON")
+INVALID_MESSAGE = _error("Invalid message format")
+JOIN_REJECTED = _error(
+    "Unable to join game. Your session may have expired or the game is full."
+)
+
+OPPONENT_SESSION_EXPIRED = _encode({
+    "type": "opponent_session_expired",
+    "message": "Your opponent's session has expired and they cannot rejoin this game.",
+})
+
+# Lifecycle broadcasts, one variant per mode / starting player
+GAME_READY = {
+    mode: _encode({
+        "type": "game_ready",
+        "message": f"Both players connected. Place your planes! ({mode.plane_count} planes each)",
+    })
+    for mode in GameMode
+}
+GAME_STARTED = {
+    pid: _encode({"type": "game_started", "current_turn": pid})
+    for pid in PlayerID.both()
+}
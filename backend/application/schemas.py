@@ -4,6 +4,7 @@ WebSocket message schemas for input validation.
 import logging
 from typing import Literal, Union
 from pydantic import BaseModel, field_validator
+from domain.game_logic import BOARD_RANGE
 from domain.value_objects import PlaneOrientation
 
 logger = logging.getLogger(__name__)
@@ -18,8 +19,8 @@ class PlacePlaneMessage(BaseModel):
     @field_validator("head_x", "head_y")
     @classmethod
     def coords_in_range(cls, v: int) -> int:
-        if not (0 <= v <= 9):
-            raise ValueError(f"Coordinate must be between 0 and 9, got {v}")
+        if v not in BOARD_RANGE:
+            raise ValueError(f"Coordinate must be between 0 and {BOARD_RANGE[-1]}, got {v}")
         return v
 
     @field_validator("orientation")
@@ -39,8 +40,8 @@ class AttackMessage(BaseModel):
     @field_validator("x", "y")
     @classmethod
     def coords_in_range(cls, v: int) -> int:
-        if not (0 <= v <= 9):
-            raise ValueError(f"Coordinate must be between 0 and 9, got {v}")
+        if v not in BOARD_RANGE:
+            raise ValueError(f"Coordinate must be between 0 and {BOARD_RANGE[-1]}, got {v}")
         return v
 
 
@@ -1,8 +1,23 @@
 """
 Domain Logic - Core game rules and algorithms
 """
-from typing import List, Tuple
-from .value_objects import PlaneOrientation
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, Tuple
+from .value_objects import CellState, CellStatus, PlaneOrientation
+
+
+# Boards are stored as flat bytearrays of CellState codes, indexed y * 10 + x
+BOARD_SIZE = 10
+BOARD_CELLS = BOARD_SIZE * BOARD_SIZE
+# Valid coordinates on either axis; `x in BOARD_RANGE` is a single C-level test
+BOARD_RANGE = range(BOARD_SIZE)
+
+# CellState code -> CellStatus string, and the reverse, for the API boundary
+CELL_NAMES: Tuple[str, ...] = tuple(CellStatus[state.name].value for state in CellState)
+CELL_CODES: Mapping[str, int] = MappingProxyType(
+    {name: code for code, name in enumerate(CELL_NAMES)}
+)
 
 
 # Plane matrix definition (UP orientation)
@@ -41,70 +56,126 @@ def get_oriented_matrix(orientation: PlaneOrientation):
         return rotate_matrix_left(PLANE_MATRIX_UP)
 
 
+def _compute_offsets(orientation: PlaneOrientation) -> Tuple[Tuple[int, int], ...]:
+    """Scan the oriented matrix once and return (dx, dy) offsets from the head.
+
+    The head offset (0, 0) comes first, followed by the body cells.
+    """
+    matrix = get_oriented_matrix(orientation)
+    cells = [
+        (mx, my, cell)
+        for my, row in enumerate(matrix)
+        for mx, cell in enumerate(row)
+        if cell in ('H', 'B')
+    ]
+    head_mx, head_my = next((mx, my) for mx, my, cell in cells if cell == 'H')
+    body = tuple((mx - head_mx, my - head_my) for mx, my, cell in cells if cell == 'B')
+    return ((0, 0),) + body
+
+
+# Head-relative cell offsets for every orientation, precomputed at import time
+# so placing a plane never has to rotate or scan a matrix.  These lookup tables
+# are shared by every game, so they are exposed read-only.
+PLANE_OFFSETS: Mapping[PlaneOrientation, Tuple[Tuple[int, int], ...]] = MappingProxyType({
+    orientation: _compute_offsets(orientation) for orientation in PlaneOrientation
+})
+
+
+def _bounding_box(offsets: Tuple[Tuple[int, int], ...]) -> Tuple[int, int, int, int]:
+    xs = [dx for dx, _ in offsets]
+    ys = [dy for _, dy in offsets]
+    return min(xs), max(xs), min(ys), max(ys)
+
+
+# (min_dx, max_dx, min_dy, max_dy) around the head, so a bounds check is 4 compares
+PLANE_BBOX: Mapping[PlaneOrientation, Tuple[int, int, int, int]] = MappingProxyType({
+    orientation: _bounding_box(offsets) for orientation, offsets in PLANE_OFFSETS.items()
+})
+
+
+# Only 400 (head, orientation) combinations exist on the board, and the result
+# is immutable, so every plane placed at the same spot shares one tuple
+@lru_cache(maxsize=BOARD_CELLS * len(PlaneOrientation))
 def get_plane_positions(
     head_x: int, 
     head_y: int, 
     orientation: PlaneOrientation
-) -> Tuple[List[Tuple[int, int]], Tuple[int, int]]:
+) -> Tuple[Tuple[Tuple[int, int], ...], Tuple[int, int]]:
     """
     Calculate all positions for a plane given head position and orientation.
     
     Returns:
-        Tuple of (positions_list, head_position)
-        - positions_list: All 10 cells (head first, then body cells)
+        Tuple of (positions, head_position)
+        - positions: All 10 cells as a tuple (head first, then body cells)
         - head_position: The head coordinate
     """
-    matrix = get_oriented_matrix(orientation)
+    positions = tuple((head_x + dx, head_y + dy) for dx, dy in PLANE_OFFSETS[orientation])
+    return positions, positions[0]
+
 
-    # Find H (head) inside the matrix
-    head_mx = head_my = None
-    for my, row in enumerate(matrix):
-        for mx, cell in enumerate(row):
-            if cell == 'H':
-                head_mx, head_my = mx, my
-                break
-        if head_mx is not None:
-            break
+def cell_bit(x: int, y: int) -> int:
+    """Bit for cell (x, y) in a 100-bit board mask, matching the flat board index."""
+    return 1 << (y * BOARD_SIZE + x)
 
-    positions = []
-    head_position = None
 
-    # Scan matrix and convert to board coordinates
-    for my, row in enumerate(matrix):
-        for mx, cell in enumerate(row):
-            if cell in ('H', 'B'):
-                board_x = head_x + (mx - head_mx)
-                board_y = head_y + (my - head_my)
+def positions_mask(positions: Iterable[Tuple[int, int]]) -> int:
+    """OR together the cell bits of every position."""
+    mask = 0
+    for x, y in positions:
+        mask |= cell_bit(x, y)
+    return mask
 
-                if cell == 'H':
-                    head_position = (board_x, board_y)
-                else:
-                    positions.append((board_x, board_y))
 
-    # Ensure head is first in positions array
-    positions.insert(0, head_position)
+# Each orientation's cell mask with its bounding box anchored at cell (0, 0).
+# Shifting left by the board index of the box's top-left corner places it;
+# the bounds check guarantees no row wraps.
+PLANE_MASKS: Mapping[PlaneOrientation, int] = MappingProxyType({
+    orientation: positions_mask([
+        (dx - PLANE_BBOX[orientation][0], dy - PLANE_BBOX[orientation][2])
+        for dx, dy in offsets
+    ])
+    for orientation, offsets in PLANE_OFFSETS.items()
+})
 
-    return positions, head_position
+
+def board_to_grid(board: bytes) -> List[List[str]]:
+    """Expand a flat board into the 10x10 grid of cell names used by the API."""
+    cells = [CELL_NAMES[code] for code in board]
+    return [cells[i:i + BOARD_SIZE] for i in range(0, BOARD_CELLS, BOARD_SIZE)]
+
+
+def grid_to_board(grid: List[List[str]]) -> bytearray:
+    """Pack a 10x10 grid of cell names back into a flat board."""
+    return bytearray(CELL_CODES[cell] for row in grid for cell in row)
 
 
 def is_valid_placement(
-    positions: List[Tuple[int, int]], 
-    existing_board: List[List[str]],
-    board_size: int = 10
-) -> Tuple[bool, str]:
+    head_x: int,
+    head_y: int,
+    orientation: PlaneOrientation,
+    occupied: int,
+) -> Tuple[bool, str, int]:
     """
-    Validate if a plane can be placed at the given positions.
+    Validate if a plane can be placed with its head at the given cell.
+
+    ``occupied`` is the bitmask of cells already covered by the player's
+    planes (see cell_bit).
     
     Returns:
-        Tuple of (is_valid, error_message)
+        Tuple of (is_valid, error_message, plane_mask); plane_mask is 0
+        when the placement is invalid
     """
-    for x, y in positions:
-        # Check bounds
-        if x < 0 or x >= board_size or y < 0 or y >= board_size:
-            return False, "Plane out of bounds"
-        
-        # Check overlap
-        if existing_board[y][x] != "empty":
-            return False, "Plane overlaps with another plane"
+    # Check bounds against the plane's bounding box
+    min_dx, max_dx, min_dy, max_dy = PLANE_BBOX[orientation]
+    if (head_x + min_dx < 0 or head_x + max_dx >= BOARD_SIZE
+            or head_y + min_dy < 0 or head_y + max_dy >= BOARD_SIZE):
+        return False, "Plane out of bounds", 0
+
+    # Check overlap
+    mask = PLANE_MASKS[orientation] << (
+        (head_y + min_dy) * BOARD_SIZE + (head_x + min_dx)
+    )
+    if occupied & mask:
+        return False, "Plane overlaps with another plane", 0
     
-    return True, "Valid placement"
+    return True, "Valid placement", mask
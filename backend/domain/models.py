@@ -2,19 +2,47 @@
 Domain Models - Core entities
 """
 import time
+from dataclasses import dataclass, field
 from typing import List, Tuple, Dict, Optional
-from pydantic import BaseModel
-from .value_objects import PlaneOrientation, GameState, GameMode, CellStatus, PlayerID
-from .game_logic import get_plane_positions, is_valid_placement
+from .value_objects import PlaneOrientation, GameState, GameMode, CellState, PlayerID
+from .game_logic import (
+    BOARD_CELLS, BOARD_RANGE, BOARD_SIZE, CELL_CODES,
+    board_to_grid, cell_bit, get_plane_positions, is_valid_placement, positions_mask,
+)
 
+# bytes.translate table for the opponent's view: unhit plane cells read as empty
+_MASK_TABLE = bytes(
+    CellState.EMPTY if code in (CellState.PLANE, CellState.HEAD) else code
+    for code in range(256)
+)
+_ATTACKED_CELLS = (CellState.HIT, CellState.MISS, CellState.HEAD_HIT)
 
-class Plane(BaseModel):
+
+@dataclass(slots=True)
+class Plane:
     """Represents a single plane on the board"""
-    positions: List[Tuple[int, int]]
+    positions: Tuple[Tuple[int, int], ...]
     head_position: Tuple[int, int]
     orientation: PlaneOrientation
-    hit_positions: List[Tuple[int, int]] = []
-    is_destroyed: bool = False
+    # Bitmask of the cells of this plane that have been hit
+    hit_mask: int = 0
+    # Bitmask of every cell this plane covers (see game_logic.cell_bit), so hit
+    # tests are a single AND; derived from positions when not supplied
+    mask: int = field(default=0, repr=False, compare=False)
+    head_bit: int = field(init=False, default=0, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.mask:
+            self.mask = positions_mask(self.positions)
+        self.head_bit = cell_bit(*self.head_position)
+
+    @property
+    def is_destroyed(self) -> bool:
+        return bool(self.hit_mask & self.head_bit)
+
+    @property
+    def hit_positions(self) -> List[Tuple[int, int]]:
+        return [pos for pos in self.positions if cell_bit(*pos) & self.hit_mask]
 
     def receive_attack(self, x: int, y: int) -> str:
         """
@@ -23,30 +51,45 @@ class Plane(BaseModel):
         Returns:
             "head_hit", "hit", or None if position not part of plane
         """
-        position = (x, y)
-        
-        if position == self.head_position:
-            self.is_destroyed = True
-            self.hit_positions.append(position)
+        # Off-board coordinates would alias onto other cells' bits
+        if x not in BOARD_RANGE or y not in BOARD_RANGE:
+            return None
+        bit = cell_bit(x, y)
+        if not bit & self.mask:
+            return None
+
+        self.hit_mask |= bit
+        if bit == self.head_bit:
             return "head_hit"
-        elif position in self.positions:
-            self.hit_positions.append(position)
-            return "hit"
-        
-        return None
+        return "hit"
 
 
 class Game:
     """Game aggregate root - manages all game state and rules"""
+
+    __slots__ = (
+        "id", "mode", "players", "boards", "planes",
+        "_occupied", "_heads", "_hits", "_masked_cache",
+        "state", "current_turn", "ready", "session_tokens",
+        "created_at", "finished_at", "rematch_requested_by", "rematch_game_id",
+        "disconnected_at",
+    )
     
     def __init__(self, game_id: str, mode: GameMode = GameMode.CLASSIC):
         self.id = game_id
         self.mode = mode
         self.players: Dict[str, Optional[object]] = PlayerID.make_dict(lambda: None)
-        self.boards: Dict[str, List[List[str]]] = PlayerID.make_dict(
-            lambda: [["empty" for _ in range(10)] for _ in range(10)]
-        )
+        self.boards: Dict[str, bytearray] = PlayerID.make_dict(lambda: bytearray(BOARD_CELLS))
         self.planes: Dict[str, List[Plane]] = PlayerID.make_dict(lambda: [])
+        # Bitmask of cells covered by each player's planes (see rebuild_indexes)
+        self._occupied: Dict[str, int] = PlayerID.make_dict(lambda: 0)
+        # Head bits of each player's planes, and the plane cells hit so far;
+        # a player has lost once every head bit is in their hit mask
+        self._heads: Dict[str, int] = PlayerID.make_dict(lambda: 0)
+        self._hits: Dict[str, int] = PlayerID.make_dict(lambda: 0)
+        # Masked grid of each player's board as the opponent sees it, rebuilt
+        # only after that board changes (get_boards is far more frequent)
+        self._masked_cache: Dict[str, Optional[List[List[str]]]] = PlayerID.make_dict(lambda: None)
         self.state = GameState.WAITING
         self.current_turn: str = PlayerID.PLAYER1
         self.ready: Dict[str, bool] = PlayerID.make_dict(lambda: False)
@@ -73,29 +116,32 @@ class Game:
         head_y = plane_data["head_y"]
         orientation = PlaneOrientation(plane_data["orientation"])
         
-        positions, head = get_plane_positions(head_x, head_y, orientation)
-        
         # Validate placement
-        is_valid, error_msg = is_valid_placement(positions, self.boards[player_id])
+        is_valid, error_msg, mask = is_valid_placement(
+            head_x, head_y, orientation, self._occupied[player_id]
+        )
         if not is_valid:
             return False, error_msg
+
+        positions, head = get_plane_positions(head_x, head_y, orientation)
         
         # Place plane on board
-        for pos in positions:
-            x, y = pos
-            if pos == head:
-                self.boards[player_id][y][x] = "head"
-            else:
-                self.boards[player_id][y][x] = "plane"
+        board = self.boards[player_id]
+        for x, y in positions:
+            board[y * BOARD_SIZE + x] = CellState.PLANE
+        board[head[1] * BOARD_SIZE + head[0]] = CellState.HEAD
         
         # Store plane entity
         plane = Plane(
             positions=positions,
             head_position=head,
             orientation=orientation,
-            is_destroyed=False
+            mask=mask,
         )
         self.planes[player_id].append(plane)
+        self._occupied[player_id] |= mask
+        self._heads[player_id] |= plane.head_bit
+        self._masked_cache[player_id] = None
         
         return True, "Plane placed successfully"
 
@@ -108,25 +154,32 @@ class Game:
         """
         defender = PlayerID(attacker).opponent
         
-        # Validate bounds
-        if x < 0 or x >= 10 or y < 0 or y >= 10:
+        # AttackMessage already range-checks client input; this guard keeps
+        # direct callers from indexing off the board (negative x would wrap
+        # onto another cell of the flat bytearray)
+        if x not in BOARD_RANGE or y not in BOARD_RANGE:
             return None
         
-        cell = self.boards[defender][y][x]
+        board = self.boards[defender]
+        index = y * BOARD_SIZE + x
         
         # Check if already attacked
-        if cell in ("hit", "head_hit", "miss"):
+        if board[index] in _ATTACKED_CELLS:
             return "already_attacked"
         
-        # Process attack on each plane
-        for plane in self.planes[defender]:
-            result = plane.receive_attack(x, y)
-            if result:
-                self.boards[defender][y][x] = result
-                return result
+        bit = cell_bit(x, y)
+        if bit & self._occupied[defender]:
+            self._hits[defender] |= bit
+            for plane in self.planes[defender]:
+                result = plane.receive_attack(x, y)
+                if result:
+                    board[index] = CELL_CODES[result]
+                    self._masked_cache[defender] = None
+                    return result
         
         # Miss
-        self.boards[defender][y][x] = "miss"
+        board[index] = CellState.MISS
+        self._masked_cache[defender] = None
         return "miss"
 
     def check_winner(self) -> Optional[str]:
@@ -139,27 +192,45 @@ class Game:
         max_planes = self.mode.plane_count
         for player_id in PlayerID.both():
             if len(self.planes[player_id]) == max_planes:  # Player has placed all planes
-                destroyed_count = sum(1 for plane in self.planes[player_id] if plane.is_destroyed)
-                if destroyed_count == max_planes:
+                heads = self._heads[player_id]
+                if self._hits[player_id] & heads == heads:
                     # This player lost, return opponent as winner
                     return player_id.opponent
         return None
 
+    def rebuild_indexes(self):
+        """Recompute derived masks after planes or boards are assigned directly (e.g. on restore)"""
+        for player_id in PlayerID.both():
+            occupied = heads = hits = 0
+            for plane in self.planes[player_id]:
+                occupied |= plane.mask
+                heads |= plane.head_bit
+                hits |= plane.hit_mask
+            self._occupied[player_id] = occupied
+            self._heads[player_id] = heads
+            self._hits[player_id] = hits
+            self._masked_cache[player_id] = None
+
+    def get_board(self, player_id: str) -> List[List[str]]:
+        """Return a player's own board as a 10x10 grid of cell names"""
+        return board_to_grid(self.boards[player_id])
+
+    def get_masked_cells(self, player_id: str) -> bytearray:
+        """Return opponent's flat board with planes hidden"""
+        opponent = PlayerID(player_id).opponent
+        return self.boards[opponent].translate(_MASK_TABLE)
+
     def get_masked_board(self, player_id: str) -> List[List[str]]:
-        """Return opponent's board with planes hidden"""
+        """Return opponent's board with planes hidden, as a grid of cell names.
+
+        The grid is cached until the opponent's board next changes, so callers
+        must treat it as read-only.
+        """
         opponent = PlayerID(player_id).opponent
-        masked = []
-        
-        for row in self.boards[opponent]:
-            masked_row = []
-            for cell in row:
-                if cell in ("plane", "head"):
-                    masked_row.append("empty")
-                else:
-                    masked_row.append(cell)
-            masked.append(masked_row)
-        
-        return masked
+        grid = self._masked_cache[opponent]
+        if grid is None:
+            grid = self._masked_cache[opponent] = board_to_grid(self.get_masked_cells(player_id))
+        return grid
 
     def mark_player_ready(self, player_id: str):
         """Mark player as ready after placing all planes"""
@@ -1,7 +1,7 @@
 """
 Domain Value Objects - Enums and immutable types
 """
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class CellStatus(str, Enum):
@@ -14,6 +14,20 @@ class CellStatus(str, Enum):
     HEAD_HIT = "head_hit"
 
 
+class CellState(IntEnum):
+    """Compact integer encoding of a cell, as stored in the flat board bytes.
+
+    Members mirror CellStatus by name; CellStatus remains the string form
+    used on the wire and in persisted games.
+    """
+    EMPTY = 0
+    PLANE = 1
+    HEAD = 2
+    HIT = 3
+    MISS = 4
+    HEAD_HIT = 5
+
+
 class PlaneOrientation(str, Enum):
     """Represents the orientation of a plane"""
     UP = "up"
@@ -47,7 +61,7 @@ class PlayerID(str, Enum):
 
     @property
     def opponent(self) -> "PlayerID":
-        return PlayerID.PLAYER2 if self == PlayerID.PLAYER1 else PlayerID.PLAYER1
+        return _OPPONENTS[self]
 
     @classmethod
     def both(cls) -> tuple["PlayerID", "PlayerID"]:
@@ -56,4 +70,7 @@ class PlayerID(str, Enum):
     @classmethod
     def make_dict(cls, default_factory):
         """Create a {PLAYER1: ..., PLAYER2: ...} dict using a factory callable."""
-        return {pid: default_factory() for pid in cls.both()}
\ No newline at end of file
+        return {pid: default_factory() for pid in cls.both()}
+
+
+_OPPONENTS = {PlayerID.PLAYER1: PlayerID.PLAYER2, PlayerID.PLAYER2: PlayerID.PLAYER1}
@@ -1,44 +1,176 @@
 """
 Infrastructure - WebSocket Connection Management
 """
+import asyncio
 import logging
-from typing import Dict
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
+import orjson
 from fastapi import WebSocket
 from metrics import WS_CONNECTIONS
 
 logger = logging.getLogger(__name__)
 
+# A message is either a dict to be serialised or an already-encoded JSON string.
+Message = Union[dict, str]
+
+# Frames a client may fall behind by before it is considered lagging and dropped.
+SEND_QUEUE_SIZE = 64
+
+# Close code sent to a client whose outbound queue overflowed ("try again later").
+_LAGGING_CLOSE_CODE = 1013
+
+
+def encode_message(message: Message) -> str:
+    """Serialise a message to JSON text; pre-encoded strings pass through."""
+    if isinstance(message, str):
+        return message
+    return orjson.dumps(message).decode()
+
+
+class Connection(NamedTuple):
+    """A registered socket with its outbound queue and the task draining it."""
+    player_id: str
+    websocket: WebSocket
+    queue: asyncio.Queue
+    writer: asyncio.Task
+
 
 class ConnectionManager:
-    """Manages WebSocket connections for games"""
+    """Manages WebSocket connections for games.
+
+    Every connection gets its own bounded outbound queue and writer task, so
+    game logic only enqueues frames and never waits on a client's socket.
+    """
+
+    __slots__ = ("conns", "per_game", "_closing")
 
     def __init__(self):
-        self.active_connections: Dict[str, Dict[str, WebSocket]] = {}
+        # One hash per lookup on the (game_id, player_id) hot path; per_game
+        # lists the same connections for broadcasts.
+        self.conns: Dict[Tuple[str, str], Connection] = {}
+        self.per_game: Dict[str, List[Connection]] = {}
+        self._closing: Set[asyncio.Task] = set()
 
     async def connect(self, game_id: str, player_id: str, websocket: WebSocket):
         """Register an already-accepted WebSocket connection."""
-        if game_id not in self.active_connections:
-            self.active_connections[game_id] = {}
-        self.active_connections[game_id][player_id] = websocket
+        # No TCP_NODELAY tweak needed here: both asyncio and uvloop set it on
+        # every accepted TCP transport, so small back-to-back frames are not
+        # held back by Nagle's algorithm.
+        previous = self.conns.get((game_id, player_id))
+        if previous is not None:
+            previous.writer.cancel()
+            self.per_game[game_id].remove(previous)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        writer = asyncio.create_task(self._writer(game_id, player_id, websocket, queue))
+        connection = Connection(player_id, websocket, queue, writer)
+        self.conns[(game_id, player_id)] = connection
+        self.per_game.setdefault(game_id, []).append(connection)
         WS_CONNECTIONS.inc()
 
-    def disconnect(self, game_id: str, player_id: str):
-        """Remove a WebSocket connection"""
-        if game_id in self.active_connections and player_id in self.active_connections[game_id]:
-            del self.active_connections[game_id][player_id]
+    def _unregister(self, game_id: str, player_id: str) -> Optional[Connection]:
+        connection = self.conns.pop((game_id, player_id), None)
+        if connection is not None:
+            connections = self.per_game[game_id]
+            connections.remove(connection)
+            if not connections:
+                del self.per_game[game_id]
             WS_CONNECTIONS.dec()
+        return connection
+
+    def disconnect(self, game_id: str, player_id: str):
+        """Remove a WebSocket connection and stop its writer."""
+        connection = self._unregister(game_id, player_id)
+        if connection is not None:
+            connection.writer.cancel()
+
+    def remove_game(self, game_id: str):
+        """Drop every connection registered for a game."""
+        for connection in list(self.per_game.get(game_id, ())):
+            self.disconnect(game_id, connection.player_id)
+
+    def get_websocket(self, game_id: str, player_id: str) -> Optional[WebSocket]:
+        """Return the socket currently registered for a player, if any."""
+        connection = self.conns.get((game_id, player_id))
+        return connection.websocket if connection is not None else None
 
-    async def send_to_player(self, game_id: str, player_id: str, message: dict):
-        """Send a message to a specific player. Silently handles broken connections."""
-        if game_id in self.active_connections and player_id in self.active_connections[game_id]:
-            try:
-                await self.active_connections[game_id][player_id].send_json(message)
-            except Exception:
-                logger.warning("Failed to send to game=%s player=%s", game_id, player_id)
+    def _is_current(self, game_id: str, player_id: str, websocket: WebSocket) -> bool:
+        # False once a reconnect has replaced this socket in the slot
+        return self.get_websocket(game_id, player_id) is websocket
+
+    async def _writer(self, game_id: str, player_id: str, websocket: WebSocket,
+                      queue: asyncio.Queue):
+        """Write queued payloads to the socket, dropping the connection if it dies."""
+        try:
+            while True:
+                payload = await queue.get()
+                try:
+                    await websocket.send_text(payload)
+                finally:
+                    queue.task_done()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("Failed to send to game=%s player=%s", game_id, player_id)
+            # The writer is already exiting, so unregister without cancelling it
+            if self._is_current(game_id, player_id, websocket):
+                self._unregister(game_id, player_id)
+        finally:
+            # Release anything still queued so drain() never waits on a dead writer
+            while not queue.empty():
+                queue.get_nowait()
+                queue.task_done()
+
+    def _enqueue(self, game_id: str, connection: Connection, payload: str):
+        try:
+            connection.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            player_id = connection.player_id
+            logger.warning("Dropping lagging client game=%s player=%s", game_id, player_id)
+            if self._is_current(game_id, player_id, connection.websocket):
                 self.disconnect(game_id, player_id)
+            task = asyncio.create_task(self._close(connection.websocket))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close(websocket: WebSocket):
+        try:
+            await websocket.close(code=_LAGGING_CLOSE_CODE)
+        except Exception:
+            pass
+
+    def send_to_player(self, game_id: str, player_id: str, message: Message):
+        """Queue a message for a specific player. Unknown players are ignored."""
+        connection = self.conns.get((game_id, player_id))
+        if connection is not None:
+            self._enqueue(game_id, connection, encode_message(message))
+
+    def broadcast_to_game(self, game_id: str, message: Message):
+        """Broadcast a message to all players in a game.
+
+        The message is serialised once; each player's writer delivers it
+        independently, so a slow socket cannot hold up the others.
+        """
+        self._enqueue_all(game_id, list(self.per_game.get(game_id, ())), message)
+
+    def _enqueue_all(self, game_id: str, connections: List[Connection], message: Message):
+        if not connections:
+            return
+        payload = encode_message(message)
+        for connection in connections:
+            self._enqueue(game_id, connection, payload)
+
+    async def drain(self, game_id: Optional[str] = None):
+        """Wait until every queued frame (for one game, or all games) is written."""
+        if game_id is None:
+            connections = list(self.conns.values())
+        else:
+            connections = list(self.per_game.get(game_id, ()))
+        await asyncio.gather(*(connection.queue.join() for connection in connections))
 
-    async def broadcast_to_game(self, game_id: str, message: dict):
-        """Broadcast a message to all players in a game."""
-        if game_id in self.active_connections:
-            for player_id in list(self.active_connections[game_id].keys()):
-                await self.send_to_player(game_id, player_id, message)
+    async def close(self):
+        """Stop every writer task and forget all connections."""
+        writers = [connection.writer for connection in self.conns.values()]
+        for game_id in list(self.per_game):
+            self.remove_game(game_id)
+        await asyncio.gather(*writers, return_exceptions=True)
@@ -12,8 +12,9 @@ from typing import Dict, Optional
 
 import redis.asyncio as aioredis
 
+from domain.game_logic import board_to_grid, grid_to_board, positions_mask
 from domain.models import Game, Plane
-from domain.value_objects import GameState, GameMode, PlayerID
+from domain.value_objects import GameState, GameMode, PlaneOrientation, PlayerID
 
 logger = logging.getLogger(__name__)
 
@@ -108,9 +109,9 @@ class GameStore:
         return {
             "id": game.id,
             "mode": game.mode.value,
-            "boards": game.boards,
+            "boards": {pid: board_to_grid(board) for pid, board in game.boards.items()},
             "planes": {
-                pid: [p.model_dump(mode="json") for p in planes]
+                pid: [GameStore._serialize_plane(p) for p in planes]
                 for pid, planes in game.planes.items()
             },
             "state": game.state.value,
@@ -124,12 +125,32 @@ class GameStore:
             "disconnected_at": game.disconnected_at,
         }
 
+    @staticmethod
+    def _serialize_plane(plane: Plane) -> dict:
+        return {
+            "positions": plane.positions,
+            "head_position": plane.head_position,
+            "orientation": plane.orientation.value,
+            "hit_positions": plane.hit_positions,
+            "is_destroyed": plane.is_destroyed,
+        }
+
+    @staticmethod
+    def _deserialize_plane(data: dict) -> Plane:
+        # JSON turns coordinate tuples into lists; restore them
+        return Plane(
+            positions=tuple(tuple(pos) for pos in data["positions"]),
+            head_position=tuple(data["head_position"]),
+            orientation=PlaneOrientation(data["orientation"]),
+            hit_mask=positions_mask(data.get("hit_positions", [])),
+        )
+
     @staticmethod
     def _deserialize(data: dict) -> Game:
         game = Game(data["id"], mode=GameMode(data.get("mode", "classic")))
-        game.boards = data["boards"]
+        game.boards = {pid: grid_to_board(grid) for pid, grid in data["boards"].items()}
         game.planes = {
-            pid: [Plane(**p) for p in planes]
+            pid: [GameStore._deserialize_plane(p) for p in planes]
             for pid, planes in data["planes"].items()
         }
         game.state = GameState(data["state"])
@@ -141,5 +162,6 @@ class GameStore:
         game.rematch_requested_by = data.get("rematch_requested_by")
         game.rematch_game_id = data.get("rematch_game_id")
         game.disconnected_at = data.get("disconnected_at", PlayerID.make_dict(lambda: None))
+        game.rebuild_indexes()
         # players stay None — they reconnect via WebSocket
         return game
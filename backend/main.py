@@ -2,22 +2,26 @@
 FastAPI Application - API Layer / Presentation Layer
 """
 import asyncio
-import json
 import logging
 import os
 import time
 from collections import defaultdict
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from prometheus_client import make_asgi_app
 from pydantic import ValidationError
+from application import messages
 from application.game_service import GameService
-from application.schemas import parse_client_message, AuthMessage, CreateGameRequest
+from application.schemas import (
+    parse_client_message, AttackMessage, AuthMessage, ClientMessage, CreateGameRequest,
+    GetBoardsMessage, PlacePlaneMessage,
+)
 from domain.models import GameState
-from domain.value_objects import GameMode
+from domain.value_objects import GameMode, PlayerID
 from infrastructure.game_store import GameStore
 from metrics import HTTP_REQUESTS, HTTP_REQUEST_DURATION, WS_MESSAGES_RECEIVED
 
@@ -66,7 +70,8 @@ async def lifespan(app: FastAPI):
     await game_service.shutdown()
 
 
-app = FastAPI(title="Warplanes API", lifespan=lifespan)
+# REST responses are serialised with orjson, like the WebSocket frames
+app = FastAPI(title="Warplanes API", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Prometheus metrics endpoint — scraped by the Prometheus container over the
 # internal Docker network.  Nginx blocks external access to /metrics.
@@ -159,7 +164,7 @@ async def rate_limit_middleware(request: Request, call_next):
 
     if len(_rate_limit_store[client_ip]) > RATE_LIMIT_MAX_REQUESTS:
         HTTP_REQUESTS.labels(method=request.method, endpoint=request.url.path, status="429").inc()
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=429,
             content={"detail": "Too many requests. Try again later."}
         )
@@ -191,12 +196,12 @@ async def create_game(body: CreateGameRequest = CreateGameRequest()):
 @app.get("/api/game/{game_id}")
 async def get_game(game_id: str):
     """Get game information"""
-    game_info = await game_service.get_game_info(game_id)
+    game_info = await game_service.get_game_info_json(game_id)
 
     if not game_info:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    return game_info
+    return Response(content=game_info, media_type="application/json")
 
 
 # WebSocket security limits
@@ -216,6 +221,59 @@ def _check_ws_origin(websocket: WebSocket) -> bool:
     return origin in allowed_origins
 
 
+async def _receive_frame(websocket: WebSocket) -> str | bytes:
+    """Return the payload of the next text or binary frame.
+
+    The browser client sends text frames; other clients may send binary
+    ones.  orjson parses either, so bytes are never decoded to str first.
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    if message.get("bytes") is not None:
+        return message["bytes"]
+    return message.get("text") or ""
+
+
+async def _handle_place_plane(game_id: str, player_id: str, message: PlacePlaneMessage):
+    await game_service.handle_plane_placement(game_id, player_id, message.model_dump())
+
+
+async def _handle_attack(game_id: str, player_id: str, message: AttackMessage):
+    await game_service.handle_attack(game_id, player_id, message.x, message.y)
+
+
+async def _handle_rematch(game_id: str, player_id: str, message: ClientMessage):
+    await game_service.handle_rematch_request(game_id, player_id)
+
+
+async def _handle_get_boards(game_id: str, player_id: str, message: GetBoardsMessage):
+    game = await game_service.get_game(game_id)
+    if not game:
+        return
+    opponent = PlayerID(player_id).opponent
+    opponent_board = (
+        game.get_board(opponent)
+        if game.state == GameState.FINISHED
+        else game.get_masked_board(player_id)
+    )
+    game_service.connection_manager.send_to_player(game_id, player_id, {
+        "type": "boards_update",
+        "own_board": game.get_board(player_id),
+        "opponent_board": opponent_board
+    })
+
+
+# One handler per client message type; parse_client_message only yields these
+_HANDLERS = {
+    "place_plane": _handle_place_plane,
+    "attack": _handle_attack,
+    "request_rematch": _handle_rematch,
+    "accept_rematch": _handle_rematch,
+    "get_boards": _handle_get_boards,
+}
+
+
 @app.websocket("/ws/{game_id}")
 async def websocket_endpoint(websocket: WebSocket, game_id: str):
     """WebSocket endpoint for real-time gameplay"""
@@ -238,11 +296,11 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str):
     # so it stays out of browser history, proxy logs, and Referer headers.
     await websocket.accept()
     try:
-        raw_auth = await asyncio.wait_for(websocket.receive_text(), timeout=5.0)
-        auth_data = json.loads(raw_auth)
+        raw_auth = await asyncio.wait_for(_receive_frame(websocket), timeout=5.0)
+        auth_data = orjson.loads(raw_auth)
         auth_msg = AuthMessage.model_validate(auth_data)
         token = auth_msg.token
-    except (asyncio.TimeoutError, json.JSONDecodeError, ValidationError):
+    except (asyncio.TimeoutError, orjson.JSONDecodeError, ValidationError):
         await websocket.close(code=1008)
         return
 
@@ -256,15 +314,11 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str):
         # after a finished game, where the opponent leaving is expected.
         game = await game_service.get_game(game_id)
         if not game or game.state != GameState.FINISHED:
-            await game_service.connection_manager.broadcast_to_game(game_id, {
-                "type": "opponent_session_expired",
-                "message": "Your opponent's session has expired and they cannot rejoin this game.",
-            })
+            game_service.connection_manager.broadcast_to_game(
+                game_id, messages.OPPONENT_SESSION_EXPIRED
+            )
         try:
-            await websocket.send_json({
-                "type": "error",
-                "message": "Unable to join game. Your session may have expired or the game is full.",
-            })
+            await websocket.send_text(messages.JOIN_REJECTED)
         except Exception:
             pass
         await websocket.close(code=1008)
@@ -275,14 +329,14 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str):
 
     try:
         while True:
-            # #15 — Message size limit: read raw text, check length, then parse
-            raw = await websocket.receive_text()
+            # #15 — Message size limit: read the raw frame, check length, then parse
+            raw = await _receive_frame(websocket)
             WS_MESSAGES_RECEIVED.inc()
 
             if len(raw) > _WS_MAX_MSG_SIZE:
-                await game_service.connection_manager.send_to_player(
+                game_service.connection_manager.send_to_player(
                     game_id, player_id,
-                    {"type": "error", "message": "Message too large"},
+                    messages.MESSAGE_TOO_LARGE,
                 )
                 continue
 
@@ -290,55 +344,30 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str):
             now = time.time()
             msg_timestamps = [t for t in msg_timestamps if t > now - 1.0]
             if len(msg_timestamps) >= _WS_MSG_PER_SECOND:
-                await game_service.connection_manager.send_to_player(
+                game_service.connection_manager.send_to_player(
                     game_id, player_id,
-                    {"type": "error", "message": "Too many messages, slow down"},
+                    messages.RATE_LIMITED,
                 )
                 continue
             msg_timestamps.append(now)
 
             # Parse JSON (replaces receive_json)
             try:
-                data = json.loads(raw)
-            except (json.JSONDecodeError, ValueError):
-                await game_service.connection_manager.send_to_player(
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                game_service.connection_manager.send_to_player(
                     game_id, player_id,
-                    {"type": "error", "message": "Invalid JSON"},
+                    messages.INVALID_JSON,
                 )
                 continue
 
             message = parse_client_message(data)
 
             if message is None:
-                await game_service.connection_manager.send_to_player(game_id, player_id, {
-                    "type": "error",
-                    "message": "Invalid message format"
-                })
+                game_service.connection_manager.send_to_player(game_id, player_id, messages.INVALID_MESSAGE)
                 continue
 
-            if message.type == "place_plane":
-                await game_service.handle_plane_placement(game_id, player_id, message.model_dump())
-
-            elif message.type == "attack":
-                await game_service.handle_attack(game_id, player_id, message.x, message.y)
-
-            elif message.type in ("request_rematch", "accept_rematch"):
-                await game_service.handle_rematch_request(game_id, player_id)
-
-            elif message.type == "get_boards":
-                game = await game_service.get_game(game_id)
-                if game:
-                    opponent = "player2" if player_id == "player1" else "player1"
-                    opponent_board = (
-                        game.boards[opponent]
-                        if game.state == GameState.FINISHED
-                        else game.get_masked_board(player_id)
-                    )
-                    await game_service.connection_manager.send_to_player(game_id, player_id, {
-                        "type": "boards_update",
-                        "own_board": game.boards[player_id],
-                        "opponent_board": opponent_board
-                    })
+            await _HANDLERS[message.type](game_id, player_id, message)
 
     except WebSocketDisconnect:
         await game_service.handle_player_disconnection(game_id, player_id, websocket)
@@ -354,4 +383,14 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, ws_ping_interval=30, ws_ping_timeout=10)
+    # Deliberately a single worker: games, session slots and open sockets
+    # (ConnectionManager) live in this process, so both players of a game
+    # must reach the same worker.  Scale out only after moving that state
+    # and the fan-out behind Redis.
+    uvicorn.run(
+        app, host="0.0.0.0", port=8000, workers=1,
+        loop="uvloop", http="httptools", ws="websockets",
+        ws_ping_interval=30, ws_ping_timeout=10,
+        # Game frames are tiny JSON; compressing them costs more than it saves
+        ws_per_message_deflate=False,
+    )
@@ -59,10 +59,37 @@ _aioredis.from_url = lambda *args, **kwargs: FakeRedis()
 # Shared pytest fixtures
 # ---------------------------------------------------------------------------
 import pytest
+import pytest_asyncio
+import copy
+from domain.game_logic import get_plane_positions
+from domain.models import Game
+from domain.value_objects import PlaneOrientation
 from infrastructure.game_store import GameStore
 from application.game_service import GameService
 
 
+@pytest.fixture(scope="session")
+def plane_cache():
+    """(positions, head) for a plane headed at (5, 5), per orientation.
+
+    Values are tuples so no test can mutate the shared geometry.
+    """
+    return {
+        orientation: get_plane_positions(5, 5, orientation)
+        for orientation in PlaneOrientation
+    }
+
+
+# Built once; each test gets a deep copy so no state leaks between tests
+_EMPTY_GAME = Game("t")
+
+
+@pytest.fixture
+def game():
+    """A fresh classic-mode Game with no players or planes."""
+    return copy.deepcopy(_EMPTY_GAME)
+
+
 @pytest.fixture
 def game_store():
     """A GameStore backed by a fresh FakeRedis."""
@@ -71,7 +98,10 @@ def game_store():
     return store
 
 
-@pytest.fixture
-def service(game_store):
+@pytest_asyncio.fixture
+async def service(game_store):
     """A GameService wired to a FakeRedis-backed GameStore."""
-    return GameService(game_store=game_store)
+    svc = GameService(game_store=game_store)
+    yield svc
+    # Stop connection writers before the test's event loop closes
+    await svc.connection_manager.close()
@@ -1,12 +1,15 @@
 """
-Tests for ConnectionManager — WebSocket send error handling.
+Tests for ConnectionManager — queued sends and WebSocket error handling.
 
 Verifies that broken WebSocket connections don't crash the game loop
 and are cleaned up automatically.
 """
+import asyncio
+import json
 import pytest
+import pytest_asyncio
 from domain.value_objects import PlayerID
-from infrastructure.connection_manager import ConnectionManager
+from infrastructure.connection_manager import ConnectionManager, SEND_QUEUE_SIZE, encode_message
 
 
 class _GoodWebSocket:
@@ -14,111 +17,248 @@ class _GoodWebSocket:
     def __init__(self):
         self.messages: list[dict] = []
 
-    async def send_json(self, data: dict):
-        self.messages.append(data)
+    async def send_text(self, data: str):
+        self.messages.append(json.loads(data))
 
 
 class _BrokenWebSocket:
     """Mock WebSocket that raises on send (simulates a dropped connection)."""
-    async def send_json(self, data: dict):
+    async def send_text(self, data: str):
         raise ConnectionError("client gone")
 
 
+class _SlowWebSocket:
+    """Mock WebSocket whose send blocks until released (simulates backpressure)."""
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.messages: list[dict] = []
+        self.close_code = None
+
+    async def close(self, code: int = 1000):
+        self.close_code = code
+
+    async def send_text(self, data: str):
+        await self.release.wait()
+        self.messages.append(json.loads(data))
+
+
+@pytest_asyncio.fixture
+async def cm():
+    manager = ConnectionManager()
+    yield manager
+    await manager.close()
+
+
 class TestSendToPlayer:
 
     @pytest.mark.asyncio
-    async def test_sends_message_to_connected_player(self):
-        cm = ConnectionManager()
+    async def test_sends_message_to_connected_player(self, cm):
         ws = _GoodWebSocket()
         await cm.connect("g1", PlayerID.PLAYER1, ws)
 
-        await cm.send_to_player("g1", PlayerID.PLAYER1, {"type": "test"})
+        cm.send_to_player("g1", PlayerID.PLAYER1, {"type": "test"})
+        await cm.drain("g1")
         assert ws.messages == [{"type": "test"}]
 
     @pytest.mark.asyncio
-    async def test_noop_for_unknown_game(self):
-        cm = ConnectionManager()
+    async def test_noop_for_unknown_game(self, cm):
         # Should not raise
-        await cm.send_to_player("nonexistent", PlayerID.PLAYER1, {"type": "test"})
+        cm.send_to_player("nonexistent", PlayerID.PLAYER1, {"type": "test"})
 
     @pytest.mark.asyncio
-    async def test_noop_for_unknown_player(self):
-        cm = ConnectionManager()
+    async def test_noop_for_unknown_player(self, cm):
         ws = _GoodWebSocket()
         await cm.connect("g1", PlayerID.PLAYER1, ws)
         # Should not raise
-        await cm.send_to_player("g1", PlayerID.PLAYER2, {"type": "test"})
+        cm.send_to_player("g1", PlayerID.PLAYER2, {"type": "test"})
 
     @pytest.mark.asyncio
-    async def test_broken_send_does_not_raise(self):
-        cm = ConnectionManager()
+    async def test_broken_send_does_not_raise(self, cm):
         ws = _BrokenWebSocket()
         await cm.connect("g1", PlayerID.PLAYER1, ws)
 
         # Should NOT raise — error is caught internally
-        await cm.send_to_player("g1", PlayerID.PLAYER1, {"type": "test"})
+        cm.send_to_player("g1", PlayerID.PLAYER1, {"type": "test"})
+        await cm.drain("g1")
 
     @pytest.mark.asyncio
-    async def test_broken_send_disconnects_player(self):
-        cm = ConnectionManager()
+    async def test_broken_send_disconnects_player(self, cm):
         ws = _BrokenWebSocket()
         await cm.connect("g1", PlayerID.PLAYER1, ws)
 
-        await cm.send_to_player("g1", PlayerID.PLAYER1, {"type": "test"})
+        cm.send_to_player("g1", PlayerID.PLAYER1, {"type": "test"})
+        await cm.drain("g1")
 
         # Player should have been removed from active connections
-        assert PlayerID.PLAYER1 not in cm.active_connections.get("g1", {})
+        assert cm.get_websocket("g1", PlayerID.PLAYER1) is None
 
 
 class TestBroadcast:
 
     @pytest.mark.asyncio
-    async def test_broadcasts_to_all_players(self):
-        cm = ConnectionManager()
+    async def test_broadcasts_to_all_players(self, cm):
         ws1, ws2 = _GoodWebSocket(), _GoodWebSocket()
         await cm.connect("g1", PlayerID.PLAYER1, ws1)
         await cm.connect("g1", PlayerID.PLAYER2, ws2)
 
-        await cm.broadcast_to_game("g1", {"type": "test"})
+        cm.broadcast_to_game("g1", {"type": "test"})
+        await cm.drain("g1")
         assert ws1.messages == [{"type": "test"}]
         assert ws2.messages == [{"type": "test"}]
 
     @pytest.mark.asyncio
-    async def test_broadcast_survives_one_broken_connection(self):
+    async def test_broadcast_survives_one_broken_connection(self, cm):
         """If one player's send fails, the other should still receive the message."""
-        cm = ConnectionManager()
         ws_good = _GoodWebSocket()
         ws_broken = _BrokenWebSocket()
         await cm.connect("g1", PlayerID.PLAYER1, ws_broken)
         await cm.connect("g1", PlayerID.PLAYER2, ws_good)
 
-        await cm.broadcast_to_game("g1", {"type": "test"})
+        cm.broadcast_to_game("g1", {"type": "test"})
+        await cm.drain("g1")
 
         # Good player still got the message
         assert ws_good.messages == [{"type": "test"}]
         # Broken player was cleaned up
-        assert PlayerID.PLAYER1 not in cm.active_connections["g1"]
+        assert cm.get_websocket("g1", PlayerID.PLAYER1) is None
+
+    @pytest.mark.asyncio
+    async def test_slow_player_does_not_block_broadcast(self, cm):
+        """Each socket has its own writer: a backpressured socket doesn't delay the other."""
+        ws_slow, ws_fast = _SlowWebSocket(), _GoodWebSocket()
+        await cm.connect("g1", PlayerID.PLAYER1, ws_slow)
+        await cm.connect("g1", PlayerID.PLAYER2, ws_fast)
+
+        cm.broadcast_to_game("g1", {"type": "test"})
+        await cm.conns[("g1", PlayerID.PLAYER2)].queue.join()
+        assert ws_fast.messages == [{"type": "test"}]
+        assert ws_slow.messages == []
+
+        ws_slow.release.set()
+        await cm.drain("g1")
+        assert ws_slow.messages == [{"type": "test"}]
 
     @pytest.mark.asyncio
-    async def test_broadcast_noop_for_unknown_game(self):
-        cm = ConnectionManager()
+    async def test_broadcast_encodes_message_once(self, cm, monkeypatch):
+        """The payload is serialised once and reused for every recipient."""
+        import infrastructure.connection_manager as cm_module
+        calls = []
+        real_dumps = cm_module.orjson.dumps
+        monkeypatch.setattr(
+            cm_module.orjson, "dumps",
+            lambda obj: calls.append(obj) or real_dumps(obj),
+        )
+        ws1, ws2 = _GoodWebSocket(), _GoodWebSocket()
+        await cm.connect("g1", PlayerID.PLAYER1, ws1)
+        await cm.connect("g1", PlayerID.PLAYER2, ws2)
+
+        cm.broadcast_to_game("g1", {"type": "test"})
+        await cm.drain("g1")
+        assert len(calls) == 1
+        assert ws1.messages == ws2.messages == [{"type": "test"}]
+
+    @pytest.mark.asyncio
+    async def test_broadcast_noop_for_unknown_game(self, cm):
         # Should not raise
-        await cm.broadcast_to_game("nonexistent", {"type": "test"})
+        cm.broadcast_to_game("nonexistent", {"type": "test"})
+
+
+class TestSendQueue:
+
+    @pytest.mark.asyncio
+    async def test_queued_messages_keep_order(self, cm):
+        ws = _GoodWebSocket()
+        await cm.connect("g1", PlayerID.PLAYER1, ws)
+
+        for i in range(3):
+            cm.send_to_player("g1", PlayerID.PLAYER1, {"n": i})
+        await cm.drain()
+        assert ws.messages == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+    @pytest.mark.asyncio
+    async def test_queue_overflow_drops_and_closes_lagging_client(self, cm):
+        ws = _SlowWebSocket()
+        await cm.connect("g1", PlayerID.PLAYER1, ws)
+        await asyncio.sleep(0)  # writer starts and blocks on the first frame
+
+        # One frame is held by the blocked writer, the rest fill the queue
+        for _ in range(SEND_QUEUE_SIZE + 2):
+            cm.send_to_player("g1", PlayerID.PLAYER1, {"type": "test"})
+        for _ in range(3):  # let the close task run
+            await asyncio.sleep(0)
+
+        assert cm.get_websocket("g1", PlayerID.PLAYER1) is None
+        assert ws.close_code == 1013
+
+    @pytest.mark.asyncio
+    async def test_reconnect_cancels_stale_writer(self, cm):
+        old_ws, new_ws = _SlowWebSocket(), _GoodWebSocket()
+        await cm.connect("g1", PlayerID.PLAYER1, old_ws)
+        old_writer = cm.conns[("g1", PlayerID.PLAYER1)].writer
+
+        await cm.connect("g1", PlayerID.PLAYER1, new_ws)
+        await asyncio.sleep(0)
+        assert old_writer.cancelled()
+
+        cm.send_to_player("g1", PlayerID.PLAYER1, {"type": "test"})
+        await cm.drain("g1")
+        assert new_ws.messages == [{"type": "test"}]
+        assert old_ws.messages == []
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_writer(self, cm):
+        await cm.connect("g1", PlayerID.PLAYER1, _GoodWebSocket())
+        writer = cm.conns[("g1", PlayerID.PLAYER1)].writer
+
+        cm.disconnect("g1", PlayerID.PLAYER1)
+        await asyncio.sleep(0)
+        assert writer.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_remove_game_drops_all_connections(self, cm):
+        await cm.connect("g1", PlayerID.PLAYER1, _GoodWebSocket())
+        await cm.connect("g1", PlayerID.PLAYER2, _GoodWebSocket())
+
+        cm.remove_game("g1")
+        assert "g1" not in cm.per_game
+        assert cm.get_websocket("g1", PlayerID.PLAYER1) is None
+
+
+class TestEncodeMessage:
+
+    def test_encodes_dict(self):
+        assert json.loads(encode_message({"type": "test", "x": 1})) == {"type": "test", "x": 1}
+
+    def test_passes_through_pre_encoded_string(self):
+        payload = '{"type":"test"}'
+        assert encode_message(payload) is payload
+
+    def test_encodes_enum_values(self):
+        assert json.loads(encode_message({"player_id": PlayerID.PLAYER1})) == {"player_id": "player1"}
 
 
 class TestDisconnect:
 
     @pytest.mark.asyncio
-    async def test_disconnect_removes_player(self):
-        cm = ConnectionManager()
+    async def test_disconnect_removes_player(self, cm):
         ws = _GoodWebSocket()
         await cm.connect("g1", PlayerID.PLAYER1, ws)
 
         cm.disconnect("g1", PlayerID.PLAYER1)
-        assert PlayerID.PLAYER1 not in cm.active_connections.get("g1", {})
+        assert cm.get_websocket("g1", PlayerID.PLAYER1) is None
+
+    @pytest.mark.asyncio
+    async def test_reconnect_replaces_game_entry(self, cm):
+        """A reconnect swaps the slot in both indexes instead of adding a second entry."""
+        old_ws, new_ws = _GoodWebSocket(), _GoodWebSocket()
+        await cm.connect("g1", PlayerID.PLAYER1, old_ws)
+        await cm.connect("g1", PlayerID.PLAYER1, new_ws)
+
+        assert [c.websocket for c in cm.per_game["g1"]] == [new_ws]
+        cm.disconnect("g1", PlayerID.PLAYER1)
+        assert "g1" not in cm.per_game
 
     @pytest.mark.asyncio
-    async def test_disconnect_noop_for_unknown(self):
-        cm = ConnectionManager()
+    async def test_disconnect_noop_for_unknown(self, cm):
         # Should not raise
         cm.disconnect("nonexistent", PlayerID.PLAYER1)
@@ -1,118 +1,176 @@
+import copy
+from types import MappingProxyType
 import pytest
-from domain.game_logic import get_plane_positions
-from domain.value_objects import PlaneOrientation, GameMode, PlayerID
-from domain.models import Game
+from domain.game_logic import (
+    PLANE_BBOX, PLANE_OFFSETS, board_to_grid, cell_bit, get_plane_positions, grid_to_board,
+    is_valid_placement, positions_mask,
+)
+from domain.value_objects import CellState, PlaneOrientation, GameMode, PlayerID
+from domain.models import Game, Plane
 
 
-def normalize(positions):
-    """Sort positions for comparison"""
-    return sorted(positions)
+ORIENTATIONS = list(PlaneOrientation)
+ORIENTATION_IDS = [orientation.value for orientation in ORIENTATIONS]
+
+
+# The standard non-overlapping pair of planes that makes up a classic fleet;
+# read-only so a test can't alter the placement data others share
+PLANE_A = MappingProxyType({"head_x": 5, "head_y": 2, "orientation": "up"})
+PLANE_B = MappingProxyType({"head_x": 2, "head_y": 7, "orientation": "left"})
+
+
+def _place_two(game, player):
+    """Place PLANE_A and PLANE_B for a player"""
+    game.place_plane(player, PLANE_A)
+    game.place_plane(player, PLANE_B)
+
+
+# Attacks on player2's PLANE_A: (x, y, result, plane destroyed afterwards)
+ATTACK_CASES = [
+    (5, 4, "hit", False),       # Body
+    (5, 2, "head_hit", True),   # Head
+    (0, 0, "miss", False),      # Empty cell
+]
+ATTACK_IDS = ["body", "head", "empty"]
+
+
+@pytest.fixture
+def game_with_p2_plane(game):
+    """A game with player2's PLANE_A (UP, head at (5, 2))"""
+    game.place_plane(PlayerID.PLAYER2, PLANE_A)
+    return game
+
+
+# Expected cells of a plane for each orientation, for the heads used below
+EXPECTED_UP = frozenset({
+    (5, 2),  # Head
+    (3, 3), (4, 3), (5, 3), (6, 3), (7, 3),  # Wings
+    (5, 4),  # Body
+    (4, 5), (5, 5), (6, 5),  # Tail
+})
+EXPECTED_DOWN = frozenset({
+    (5, 7),  # Head
+    (4, 4), (5, 4), (6, 4),  # Tail
+    (5, 5),  # Body
+    (3, 6), (4, 6), (5, 6), (6, 6), (7, 6),  # Wings
+})
+EXPECTED_LEFT = frozenset({
+    (2, 5),  # Head
+    (3, 3), (3, 4), (3, 5), (3, 6), (3, 7),  # Wings
+    (4, 5),  # Body
+    (5, 4), (5, 5), (5, 6),  # Tail
+})
+EXPECTED_RIGHT = frozenset({
+    (7, 5),  # Head
+    (4, 4), (4, 5), (4, 6),  # Tail
+    (5, 5),  # Body
+    (6, 3), (6, 4), (6, 5), (6, 6), (6, 7),  # Wings
+})
 
 
 class TestPlanePositions:
     """Test plane position generation for all orientations"""
     
-    def test_plane_has_10_positions(self):
+    @pytest.mark.parametrize("orientation", ORIENTATIONS, ids=ORIENTATION_IDS)
+    def test_plane_has_10_positions(self, orientation, plane_cache):
         """Every plane should have exactly 10 cells"""
-        for orientation in [PlaneOrientation.UP, PlaneOrientation.DOWN, 
-                           PlaneOrientation.LEFT, PlaneOrientation.RIGHT]:
-            positions, head = get_plane_positions(5, 5, orientation)
-            assert len(positions) == 10, f"{orientation}: Should have 10 positions"
+        positions, head = plane_cache[orientation]
+        assert len(positions) == 10, f"{orientation}: Should have 10 positions"
     
-    def test_head_is_first_position(self):
+    @pytest.mark.parametrize("orientation", ORIENTATIONS, ids=ORIENTATION_IDS)
+    def test_head_is_first_position(self, orientation, plane_cache):
         """Head should always be the first position in the array"""
-        for orientation in [PlaneOrientation.UP, PlaneOrientation.DOWN,
-                           PlaneOrientation.LEFT, PlaneOrientation.RIGHT]:
-            positions, head = get_plane_positions(5, 5, orientation)
-            assert positions[0] == head, f"{orientation}: First position should be head"
-            assert head == (5, 5), f"{orientation}: Head should be at original coordinates"
+        positions, head = plane_cache[orientation]
+        assert positions[0] == head, f"{orientation}: First position should be head"
+
+    def test_positions_are_memoized(self):
+        """Repeat lookups hit the cache and share one immutable tuple"""
+        first, _ = get_plane_positions(4, 4, PlaneOrientation.DOWN)
+        hits = get_plane_positions.cache_info().hits
+        again, _ = get_plane_positions(4, 4, PlaneOrientation.DOWN)
+        assert again is first
+        assert isinstance(first, tuple)
+        assert get_plane_positions.cache_info().hits == hits + 1
+
+    def test_head_coords_equal_input(self):
+        """The returned head is the requested head, whatever the orientation"""
+        _, head = get_plane_positions(5, 5, PlaneOrientation.UP)
+        assert head == (5, 5)
     
-    def test_no_duplicate_positions(self):
+    @pytest.mark.parametrize("orientation", ORIENTATIONS, ids=ORIENTATION_IDS)
+    def test_no_duplicate_positions(self, orientation, plane_cache):
         """All positions should be unique"""
-        for orientation in [PlaneOrientation.UP, PlaneOrientation.DOWN,
-                           PlaneOrientation.LEFT, PlaneOrientation.RIGHT]:
-            positions, _ = get_plane_positions(5, 5, orientation)
-            assert len(positions) == len(set(positions)), f"{orientation}: Has duplicate positions"
-    
-    def test_up_orientation_positions(self):
-        """Test UP orientation creates correct pattern"""
-        positions, head = get_plane_positions(5, 2, PlaneOrientation.UP)
-        
-        expected = [
-            (5, 2),  # Head
-            (3, 3), (4, 3), (5, 3), (6, 3), (7, 3),  # Wings
-            (5, 4),  # Body
-            (4, 5), (5, 5), (6, 5)  # Tail
-        ]
-        
-        assert normalize(positions) == normalize(expected), "UP orientation positions don't match expected"
-        assert head == (5, 2), "Head position incorrect"
-    
-    def test_down_orientation_positions(self):
-        """Test DOWN orientation creates correct pattern"""
-        positions, head = get_plane_positions(5, 7, PlaneOrientation.DOWN)
-        
-        expected = [
-            (5, 7),  # Head
-            (4, 4), (5, 4), (6, 4),  # Tail
-            (5, 5),  # Body
-            (3, 6), (4, 6), (5, 6), (6, 6), (7, 6)  # Wings
-        ]
-        
-        assert normalize(positions) == normalize(expected), "DOWN orientation positions don't match expected"
-        assert head == (5, 7), "Head position incorrect"
-    
-    def test_left_orientation_positions(self):
-        """Test LEFT orientation creates correct pattern"""
-        positions, head = get_plane_positions(2, 5, PlaneOrientation.LEFT)
-        
-        expected = [
-            (2, 5),  # Head
-            (3, 3), (3, 4), (3, 5), (3, 6), (3, 7),  # Wings
-            (4, 5),  # Body
-            (5, 4), (5, 5), (5, 6)  # Tail
-        ]
-        
-        assert normalize(positions) == normalize(expected), "LEFT orientation positions don't match expected"
-        assert head == (2, 5), "Head position incorrect"
+        positions, _ = plane_cache[orientation]
+        assert len(positions) == len(set(positions)), f"{orientation}: Has duplicate positions"
     
-    def test_right_orientation_positions(self):
-        """Test RIGHT orientation creates correct pattern"""
-        positions, head = get_plane_positions(7, 5, PlaneOrientation.RIGHT)
-        
-        expected = [
-            (7, 5),  # Head
-            (4, 4), (4, 5), (4, 6),  # Tail
-            (5, 5),  # Body
-            (6, 3), (6, 4), (6, 5), (6, 6), (6, 7)  # Wings
-        ]
-        
-        assert normalize(positions) == normalize(expected), "RIGHT orientation positions don't match expected"
-        assert head == (7, 5), "Head position incorrect"
+    def test_offsets_precomputed_for_every_orientation(self):
+        """Every orientation has an offsets table"""
+        assert set(PLANE_OFFSETS) == set(PlaneOrientation)
+
+    @pytest.mark.parametrize("orientation", ORIENTATIONS, ids=ORIENTATION_IDS)
+    def test_offsets_start_at_head(self, orientation):
+        """Each orientation has 10 head-relative offsets, head (0, 0) first"""
+        offsets = PLANE_OFFSETS[orientation]
+        assert len(offsets) == 10, f"{orientation}: Should have 10 offsets"
+        assert offsets[0] == (0, 0), f"{orientation}: Head offset should come first"
+
+    def test_precomputed_tables_are_read_only(self):
+        """Shared geometry tables can't be mutated by a caller"""
+        with pytest.raises(TypeError):
+            PLANE_OFFSETS[PlaneOrientation.UP] = ()
+        with pytest.raises(TypeError):
+            PLANE_BBOX[PlaneOrientation.UP] = (0, 0, 0, 0)
+
+    @pytest.mark.parametrize("orientation", ORIENTATIONS, ids=ORIENTATION_IDS)
+    def test_bounding_box_covers_offsets(self, orientation):
+        """The precomputed bounding box is tight around every orientation's offsets"""
+        offsets = PLANE_OFFSETS[orientation]
+        min_dx, max_dx, min_dy, max_dy = PLANE_BBOX[orientation]
+        assert min(dx for dx, _ in offsets) == min_dx
+        assert max(dx for dx, _ in offsets) == max_dx
+        assert min(dy for _, dy in offsets) == min_dy
+        assert max(dy for _, dy in offsets) == max_dy
+
+    @pytest.mark.parametrize("orientation", ORIENTATIONS, ids=ORIENTATION_IDS)
+    def test_placement_mask_matches_positions_everywhere(self, orientation):
+        """The shifted per-orientation mask equals the mask of the actual cells"""
+        for head_y in range(10):
+            for head_x in range(10):
+                valid, _, mask = is_valid_placement(head_x, head_y, orientation, 0)
+                if valid:
+                    positions, _ = get_plane_positions(head_x, head_y, orientation)
+                    assert mask == positions_mask(positions), (orientation, head_x, head_y)
+
+    @pytest.mark.parametrize("head,orientation,expected", [
+        ((5, 2), PlaneOrientation.UP, EXPECTED_UP),
+        ((5, 7), PlaneOrientation.DOWN, EXPECTED_DOWN),
+        ((2, 5), PlaneOrientation.LEFT, EXPECTED_LEFT),
+        ((7, 5), PlaneOrientation.RIGHT, EXPECTED_RIGHT),
+    ], ids=["up", "down", "left", "right"])
+    def test_orientation_positions(self, head, orientation, expected):
+        """Each orientation creates the correct pattern around its head"""
+        positions, placed_head = get_plane_positions(*head, orientation)
+
+        assert set(positions) == expected, f"{orientation.value.upper()} orientation positions don't match expected"
+        assert placed_head == head, "Head position incorrect"
 
 
 class TestGamePlacement:
     """Test game plane placement validation"""
     
-    def test_place_valid_plane(self):
+    def test_place_valid_plane(self, game):
         """Should successfully place a valid plane"""
-        game = Game("test-game-1")
         
-        success, message = game.place_plane(PlayerID.PLAYER1, {
-            "head_x": 5,
-            "head_y": 2,
-            "orientation": "up"
-        })
+        success, message = game.place_plane(PlayerID.PLAYER1, PLANE_A)
         
         assert success is True, "Valid plane placement should succeed"
         assert len(game.planes[PlayerID.PLAYER1]) == 1, "Should have 1 plane placed"
     
-    def test_cannot_place_more_than_2_planes(self):
+    def test_cannot_place_more_than_2_planes(self, game):
         """Should reject placement of more than 2 planes"""
-        game = Game("test-game-2")
         
         # Place first plane
-        game.place_plane(PlayerID.PLAYER1, {"head_x": 5, "head_y": 2, "orientation": "up"})
+        game.place_plane(PlayerID.PLAYER1, PLANE_A)
         # Place second plane
         game.place_plane(PlayerID.PLAYER1, {"head_x": 5, "head_y": 9, "orientation": "down"})
         # Try to place third plane
@@ -122,21 +180,19 @@ class TestGamePlacement:
         assert "Already placed 2 planes" in message
         assert len(game.planes[PlayerID.PLAYER1]) == 2, "Should still have only 2 planes"
     
-    def test_cannot_place_overlapping_planes(self):
+    def test_cannot_place_overlapping_planes(self, game):
         """Should reject overlapping plane placement"""
-        game = Game("test-game-3")
         
         # Place first plane
-        game.place_plane(PlayerID.PLAYER1, {"head_x": 5, "head_y": 2, "orientation": "up"})
+        game.place_plane(PlayerID.PLAYER1, PLANE_A)
         # Try to place overlapping plane
         success, message = game.place_plane(PlayerID.PLAYER1, {"head_x": 5, "head_y": 3, "orientation": "up"})
         
         assert success is False, "Should reject overlapping planes"
         assert "overlap" in message.lower()
     
-    def test_cannot_place_out_of_bounds(self):
+    def test_cannot_place_out_of_bounds(self, game):
         """Should reject planes that go out of bounds"""
-        game = Game("test-game-4")
         
         # Try to place plane too close to top edge (UP orientation needs space below)
         success, message = game.place_plane(PlayerID.PLAYER1, {"head_x": 5, "head_y": 8, "orientation": "up"})
@@ -144,81 +200,131 @@ class TestGamePlacement:
         assert success is False, "Should reject out of bounds placement"
         assert "out of bounds" in message.lower()
     
-    def test_plane_positions_marked_on_board(self):
+    def test_cannot_place_out_of_bounds_on_any_edge(self, game):
+        """Each edge of the board rejects a plane that would cross it"""
+        for plane in (
+            {"head_x": 1, "head_y": 0, "orientation": "up"},     # wing past left edge
+            {"head_x": 8, "head_y": 0, "orientation": "up"},     # wing past right edge
+            {"head_x": 5, "head_y": 1, "orientation": "down"},   # tail past top edge
+            {"head_x": 0, "head_y": 5, "orientation": "right"},  # tail past left edge
+        ):
+            success, message = game.place_plane(PlayerID.PLAYER1, plane)
+            assert success is False, f"{plane} should be out of bounds"
+            assert "out of bounds" in message.lower()
+        assert game.planes[PlayerID.PLAYER1] == []
+
+    def test_plane_positions_marked_on_board(self, game):
         """Board should be updated with plane positions"""
-        game = Game("test-game-5")
         
-        game.place_plane(PlayerID.PLAYER1, {"head_x": 5, "head_y": 2, "orientation": "up"})
+        game.place_plane(PlayerID.PLAYER1, PLANE_A)
         
         # Check head is marked
-        assert game.boards[PlayerID.PLAYER1][2][5] == "head", "Head should be marked on board"
+        assert game.get_board(PlayerID.PLAYER1)[2][5] == "head", "Head should be marked on board"
         
         # Check wings are marked
-        assert game.boards[PlayerID.PLAYER1][3][3] == "plane", "Wing should be marked"
-        assert game.boards[PlayerID.PLAYER1][3][7] == "plane", "Wing should be marked"
+        assert game.get_board(PlayerID.PLAYER1)[3][3] == "plane", "Wing should be marked"
+        assert game.get_board(PlayerID.PLAYER1)[3][7] == "plane", "Wing should be marked"
         
         # Check body is marked
-        assert game.boards[PlayerID.PLAYER1][4][5] == "plane", "Body should be marked"
+        assert game.get_board(PlayerID.PLAYER1)[4][5] == "plane", "Body should be marked"
+
+
+class TestBoardLayout:
+    """Test the flat bytearray board encoding"""
+
+    def test_new_board_is_flat_and_empty(self, game):
+        """Boards are 100 zeroed cells, one byte each"""
+        board = game.boards[PlayerID.PLAYER1]
+        assert isinstance(board, bytearray)
+        assert board == bytearray(100)
+
+    def test_cells_indexed_row_major(self, game):
+        """Cell (x, y) lives at index y * 10 + x"""
+        game.place_plane(PlayerID.PLAYER1, PLANE_A)
+        assert game.boards[PlayerID.PLAYER1][2 * 10 + 5] == CellState.HEAD
+        assert game.boards[PlayerID.PLAYER1][4 * 10 + 5] == CellState.PLANE
+
+    def test_grid_round_trip(self, game):
+        """Expanding to a grid of names and packing it back is lossless"""
+        game.place_plane(PlayerID.PLAYER2, PLANE_A)
+        game.attack(PlayerID.PLAYER1, 5, 4)
+        game.attack(PlayerID.PLAYER1, 0, 0)
+        board = game.boards[PlayerID.PLAYER2]
+        assert grid_to_board(board_to_grid(board)) == board
+
+    def test_game_has_no_instance_dict(self, game):
+        """Game is slotted, so a typo'd attribute assignment fails loudly"""
+        with pytest.raises(AttributeError):
+            game.curent_turn = PlayerID.PLAYER2
+
+
+class TestPlaneReceiveAttack:
+    """Test hit detection on a single plane"""
+
+    def _plane(self):
+        positions, head = get_plane_positions(5, 2, PlaneOrientation.UP)
+        return Plane(positions=positions, head_position=head, orientation=PlaneOrientation.UP)
+
+    def test_body_hit(self):
+        plane = self._plane()
+        assert plane.receive_attack(5, 4) == "hit"
+        assert plane.is_destroyed is False
+
+    def test_head_hit_destroys(self):
+        plane = self._plane()
+        assert plane.receive_attack(5, 2) == "head_hit"
+        assert plane.is_destroyed is True
+
+    def test_hits_recorded_in_mask(self):
+        plane = self._plane()
+        plane.receive_attack(5, 4)
+        plane.receive_attack(5, 2)
+        assert plane.hit_mask == cell_bit(5, 4) | cell_bit(5, 2)
+        assert sorted(plane.hit_positions) == [(5, 2), (5, 4)]
+
+    def test_off_plane_returns_none(self):
+        plane = self._plane()
+        assert plane.receive_attack(0, 0) is None
+        assert plane.hit_positions == []
+
+    def test_off_board_coordinates_do_not_alias(self):
+        """(15, 1) shares a bit index with the head at (5, 2) but is not on the board"""
+        plane = self._plane()
+        assert plane.receive_attack(15, 1) is None
+        assert plane.receive_attack(-5, 3) is None
+        assert plane.hit_positions == []
+        assert plane.is_destroyed is False
 
 
 class TestGameAttacks:
     """Test game attack mechanics"""
     
-    def test_attack_body_cell(self):
-        """Attacking plane body should return 'hit' but not destroy plane"""
-        game = Game("test-game-6")
-        game.planes[PlayerID.PLAYER1] = []  # Reset
-        game.planes[PlayerID.PLAYER2] = []
-        
-        # Place plane for player2
-        game.place_plane(PlayerID.PLAYER2, {"head_x": 5, "head_y": 2, "orientation": "up"})
-        
-        # Player1 attacks plane body
-        result = game.attack(PlayerID.PLAYER1, 5, 4)  # Body position
-        
-        assert result == "hit", "Body hit should return 'hit'"
-        assert game.boards[PlayerID.PLAYER2][4][5] == "hit", "Board should show hit"
-        assert game.planes[PlayerID.PLAYER2][0].is_destroyed is False, "Plane should NOT be destroyed"
-    
-    def test_attack_head_cell(self):
-        """Attacking plane head should return 'head_hit' and destroy plane"""
-        game = Game("test-game-7")
-        game.planes[PlayerID.PLAYER1] = []
-        game.planes[PlayerID.PLAYER2] = []
-        
-        # Place plane for player2
-        game.place_plane(PlayerID.PLAYER2, {"head_x": 5, "head_y": 2, "orientation": "up"})
-        
-        # Player1 attacks plane head
-        result = game.attack(PlayerID.PLAYER1, 5, 2)  # Head position
-        
-        assert result == "head_hit", "Head hit should return 'head_hit'"
-        assert game.boards[PlayerID.PLAYER2][2][5] == "head_hit", "Board should show head_hit"
-        assert game.planes[PlayerID.PLAYER2][0].is_destroyed is True, "Plane SHOULD be destroyed"
-    
-    def test_attack_empty_cell(self):
-        """Attacking empty cell should return 'miss'"""
-        game = Game("test-game-8")
-        
-        result = game.attack(PlayerID.PLAYER1, 0, 0)
-        
-        assert result == "miss", "Empty cell should return 'miss'"
-        assert game.boards[PlayerID.PLAYER2][0][0] == "miss", "Board should show miss"
-    
-    def test_attack_already_attacked_cell(self):
-        """Attacking same cell twice should return 'already_attacked'"""
-        game = Game("test-game-9")
-        
-        # First attack
-        game.attack(PlayerID.PLAYER1, 0, 0)
-        # Second attack on same cell
-        result = game.attack(PlayerID.PLAYER1, 0, 0)
-        
+    @pytest.mark.parametrize("x,y,expected,destroyed", ATTACK_CASES, ids=ATTACK_IDS)
+    def test_attack_result(self, game_with_p2_plane, x, y, expected, destroyed):
+        """Body hits damage, head hits destroy, empty cells miss; the board records each"""
+        game = game_with_p2_plane
+
+        result = game.attack(PlayerID.PLAYER1, x, y)
+
+        assert result == expected
+        assert game.get_board(PlayerID.PLAYER2)[y][x] == expected, "Board should show the result"
+        assert game.planes[PlayerID.PLAYER2][0].is_destroyed is destroyed
+
+    @pytest.mark.parametrize(
+        "x,y,expected", [(x, y, r) for x, y, r, _ in ATTACK_CASES], ids=ATTACK_IDS,
+    )
+    def test_attack_already_attacked_cell(self, game_with_p2_plane, x, y, expected):
+        """Attacking any cell twice should return 'already_attacked'"""
+        game = game_with_p2_plane
+        game.attack(PlayerID.PLAYER1, x, y)
+
+        result = game.attack(PlayerID.PLAYER1, x, y)
+
         assert result == "already_attacked", "Should reject repeated attack"
+        assert game.get_board(PlayerID.PLAYER2)[y][x] == expected, "First result should stand"
     
-    def test_attack_out_of_bounds(self):
+    def test_attack_out_of_bounds(self, game):
         """Attacking out of bounds should return None"""
-        game = Game("test-game-10")
         
         result = game.attack(PlayerID.PLAYER1, 10, 10)
         assert result is None, "Out of bounds attack should return None"
@@ -229,31 +335,28 @@ class TestGameAttacks:
 
 class TestWinCondition:
     """Test game win condition logic"""
+
+    @pytest.fixture(scope="class")
+    def fleets_prototype(self):
+        """A game with both players' PLANE_A and PLANE_B placed, built once per class"""
+        game = Game("t")
+        _place_two(game, PlayerID.PLAYER1)
+        _place_two(game, PlayerID.PLAYER2)
+        return game
+
+    @pytest.fixture
+    def fleets_placed(self, fleets_prototype):
+        """A private copy of the prototype for one test to attack"""
+        return copy.deepcopy(fleets_prototype)
     
-    def test_no_winner_at_start(self):
+    def test_no_winner_at_start(self, fleets_placed):
         """Game should have no winner initially"""
-        game = Game("test-game-11")
-        game.planes[PlayerID.PLAYER1] = []
-        game.planes[PlayerID.PLAYER2] = []
-        
-        # Place planes
-        game.place_plane(PlayerID.PLAYER1, {"head_x": 5, "head_y": 2, "orientation": "up"})
-        game.place_plane(PlayerID.PLAYER1, {"head_x": 2, "head_y": 7, "orientation": "left"})
-        game.place_plane(PlayerID.PLAYER2, {"head_x": 5, "head_y": 2, "orientation": "up"})
-        game.place_plane(PlayerID.PLAYER2, {"head_x": 2, "head_y": 7, "orientation": "left"})
-        
-        winner = game.check_winner()
+        winner = fleets_placed.check_winner()
         assert winner is None, "No winner at game start"
     
-    def test_winner_after_destroying_one_plane(self):
+    def test_winner_after_destroying_one_plane(self, fleets_placed):
         """Destroying only one plane should not declare winner"""
-        game = Game("test-game-12")
-        game.planes[PlayerID.PLAYER1] = []
-        game.planes[PlayerID.PLAYER2] = []
-        
-        # Place 2 planes for player2
-        game.place_plane(PlayerID.PLAYER2, {"head_x": 5, "head_y": 2, "orientation": "up"})
-        game.place_plane(PlayerID.PLAYER2, {"head_x": 2, "head_y": 7, "orientation": "left"})
+        game = fleets_placed
         
         # Destroy first plane
         game.attack(PlayerID.PLAYER1, 5, 2)  # Hit head
@@ -261,15 +364,9 @@ class TestWinCondition:
         winner = game.check_winner()
         assert winner is None, "Should not have winner after destroying only 1 plane"
     
-    def test_winner_after_destroying_both_planes(self):
+    def test_winner_after_destroying_both_planes(self, fleets_placed):
         """Destroying both planes should declare winner"""
-        game = Game("test-game-13")
-        game.planes[PlayerID.PLAYER1] = []
-        game.planes[PlayerID.PLAYER2] = []
-        
-        # Place 2 planes for player2
-        game.place_plane(PlayerID.PLAYER2, {"head_x": 5, "head_y": 2, "orientation": "up"})
-        game.place_plane(PlayerID.PLAYER2, {"head_x": 2, "head_y": 7, "orientation": "left"})
+        game = fleets_placed
         
         # Destroy both planes
         game.attack(PlayerID.PLAYER1, 5, 2)  # Hit first head
@@ -278,17 +375,9 @@ class TestWinCondition:
         winner = game.check_winner()
         assert winner == PlayerID.PLAYER1, "Player1 should win after destroying both planes"
     
-    def test_correct_winner_identification(self):
+    def test_correct_winner_identification(self, fleets_placed):
         """Winner should be opponent of player who lost all planes"""
-        game = Game("test-game-14")
-        game.planes[PlayerID.PLAYER1] = []
-        game.planes[PlayerID.PLAYER2] = []
-        
-        # Place planes for both players
-        game.place_plane(PlayerID.PLAYER1, {"head_x": 5, "head_y": 2, "orientation": "up"})
-        game.place_plane(PlayerID.PLAYER1, {"head_x": 2, "head_y": 7, "orientation": "left"})
-        game.place_plane(PlayerID.PLAYER2, {"head_x": 5, "head_y": 2, "orientation": "up"})
-        game.place_plane(PlayerID.PLAYER2, {"head_x": 2, "head_y": 7, "orientation": "left"})
+        game = fleets_placed
         
         # Player2 destroys player1's planes
         game.attack(PlayerID.PLAYER2, 5, 2)
@@ -301,13 +390,9 @@ class TestWinCondition:
 class TestBoardMasking:
     """Test opponent board masking"""
     
-    def test_opponent_board_hides_planes(self):
+    def test_opponent_board_hides_planes(self, game_with_p2_plane):
         """Opponent's board should hide plane positions"""
-        game = Game("test-game-15")
-        game.planes[PlayerID.PLAYER2] = []
-        
-        # Place plane for player2
-        game.place_plane(PlayerID.PLAYER2, {"head_x": 5, "head_y": 2, "orientation": "up"})
+        game = game_with_p2_plane
         
         # Get masked board from player1's perspective
         masked = game.get_masked_board(PlayerID.PLAYER1)
@@ -317,13 +402,9 @@ class TestBoardMasking:
         assert masked[3][5] == "empty", "Wing should be hidden"
         assert masked[4][5] == "empty", "Body should be hidden"
     
-    def test_opponent_board_shows_hits(self):
+    def test_opponent_board_shows_hits(self, game_with_p2_plane):
         """Opponent's board should show hit and miss markers"""
-        game = Game("test-game-16")
-        game.planes[PlayerID.PLAYER2] = []
-        
-        # Place plane
-        game.place_plane(PlayerID.PLAYER2, {"head_x": 5, "head_y": 2, "orientation": "up"})
+        game = game_with_p2_plane
         
         # Attack
         game.attack(PlayerID.PLAYER1, 5, 2)  # Head hit
@@ -336,6 +417,37 @@ class TestBoardMasking:
         assert masked[4][5] == "hit", "Body hit should be visible"
         assert masked[0][0] == "miss", "Miss should be visible"
 
+    def test_masked_cells_translate_plane_codes_only(self, game_with_p2_plane):
+        """The flat masked view keeps attack markers and drops plane/head codes"""
+        game = game_with_p2_plane
+        game.attack(PlayerID.PLAYER1, 5, 4)  # Body hit
+        game.attack(PlayerID.PLAYER1, 0, 0)  # Miss
+
+        cells = game.get_masked_cells(PlayerID.PLAYER1)
+        assert isinstance(cells, bytearray) and len(cells) == 100
+        assert set(cells) == {CellState.EMPTY, CellState.HIT, CellState.MISS}
+        # The real board is untouched
+        assert game.boards[PlayerID.PLAYER2][2 * 10 + 5] == CellState.HEAD
+
+    def test_masked_board_cached_until_board_changes(self, game_with_p2_plane):
+        """Repeat reads reuse the grid; attacks and placements invalidate it"""
+        game = game_with_p2_plane
+
+        first = game.get_masked_board(PlayerID.PLAYER1)
+        assert game.get_masked_board(PlayerID.PLAYER1) is first
+
+        # Attacking player1's board leaves player2's masked view cached
+        game.attack(PlayerID.PLAYER2, 0, 0)
+        assert game.get_masked_board(PlayerID.PLAYER1) is first
+
+        game.attack(PlayerID.PLAYER1, 9, 9)
+        after_attack = game.get_masked_board(PlayerID.PLAYER1)
+        assert after_attack is not first
+        assert after_attack[9][9] == "miss"
+
+        game.place_plane(PlayerID.PLAYER2, {"head_x": 2, "head_y": 6, "orientation": "up"})
+        assert game.get_masked_board(PlayerID.PLAYER1) is not after_attack
+
 
 class TestGameModeReadyLogic:
     """Test that mark_player_ready respects mode plane count.
@@ -347,7 +459,7 @@ class TestGameModeReadyLogic:
     def test_mark_ready_respects_mode_plane_count(self):
         """Ready should require all planes for the mode (2 classic, 3 elite)."""
         for mode, count in ((GameMode.CLASSIC, 2), (GameMode.ELITE, 3)):
-            game = Game(f"ready-{mode.value}", mode=mode)
+            game = Game("t", mode=mode)
             planes = [
                 {"head_x": 2, "head_y": 0, "orientation": "up"},
                 {"head_x": 7, "head_y": 0, "orientation": "up"},
@@ -361,6 +473,20 @@ class TestGameModeReadyLogic:
             assert game.ready[PlayerID.PLAYER1] is True
 
 
-if __name__ == "__main__":
-    # Run with: python -m pytest tests/test_domain.py -v
-    pytest.main([__file__, "-v"])
+class TestDomainDependencies:
+    """The domain layer stays free of framework imports"""
+
+    def test_domain_imports_without_pydantic(self):
+        import subprocess
+        import sys
+        from pathlib import Path
+        code = (
+            "import sys; sys.modules['pydantic'] = None; "
+            "import domain.models, domain.game_logic, domain.value_objects"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[1],
+            capture_output=True, text=True,
+        )
+        assert result.returncode == 0, result.stderr
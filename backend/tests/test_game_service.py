@@ -5,6 +5,8 @@ Uses mock WebSocket objects to test the service in isolation,
 without going through HTTP/ASGI.
 """
 import asyncio
+import json
+import re
 import time
 import pytest
 from application.game_service import GameService
@@ -26,8 +28,8 @@ class MockWebSocket:
     async def accept(self):
         self.accepted = True
 
-    async def send_json(self, data: dict):
-        self.messages.append(data)
+    async def send_text(self, data: str):
+        self.messages.append(json.loads(data))
 
     async def close(self, code: int = 1000):
         self.closed = True
@@ -54,6 +56,11 @@ PLANE_3 = {"head_x": 5, "head_y": 9, "orientation": "down", "type": "place_plane
 # NOTE: the `service` fixture is provided by conftest.py (FakeRedis-backed)
 
 
+async def _flush(service: GameService):
+    """Wait for the connection writers to deliver every queued frame."""
+    await service.connection_manager.drain()
+
+
 async def _connect_two(service: GameService, game_id: str):
     """Connect two mock players and return (ws1, ws2)."""
     ws1, ws2 = MockWebSocket(), MockWebSocket()
@@ -74,6 +81,7 @@ async def _setup_playing(service: GameService):
 
     game = await service.get_game(game_id)
     assert game.state == "playing"
+    await _flush(service)
     ws1.clear()
     ws2.clear()
     return game_id, ws1, ws2
@@ -87,6 +95,7 @@ async def _play_to_finish(service: GameService):
     await service.handle_attack(gid, PlayerID.PLAYER1, 7, 0)   # head_hit → game over
     game = await service.get_game(gid)
     assert game.state == GameState.FINISHED
+    await _flush(service)
     ws1.clear()
     ws2.clear()
     return gid, ws1, ws2
@@ -99,10 +108,18 @@ async def _play_to_finish(service: GameService):
 class TestGameCreation:
 
     @pytest.mark.asyncio
-    async def test_create_returns_uuid(self, service):
+    async def test_create_returns_id(self, service):
         gid = await service.create_game()
         assert isinstance(gid, str) and len(gid) > 0
 
+    @pytest.mark.asyncio
+    async def test_game_ids_are_short_url_safe_and_unique(self, service):
+        ids = {await service.create_game() for _ in range(50)}
+        assert len(ids) == 50
+        for gid in ids:
+            assert len(gid) == 12
+            assert re.fullmatch(r"[A-Za-z0-9_-]+", gid)
+
     @pytest.mark.asyncio
     async def test_get_game(self, service):
         gid = await service.create_game()
@@ -117,13 +134,28 @@ class TestGameCreation:
     @pytest.mark.asyncio
     async def test_game_info(self, service):
         gid = await service.create_game()
-        info = await service.get_game_info(gid)
+        info = json.loads(await service.get_game_info_json(gid))
         assert info["id"] == gid
         assert info["state"] == "waiting"
         # #18 — must not expose player slots or current_turn
         assert "players" not in info
         assert "current_turn" not in info
 
+    @pytest.mark.asyncio
+    async def test_game_info_json_cached_until_state_changes(self, service):
+        gid = await service.create_game()
+        first = await service.get_game_info_json(gid)
+        assert await service.get_game_info_json(gid) is first
+
+        await _connect_two(service, gid)  # WAITING -> PLACING
+        updated = await service.get_game_info_json(gid)
+        assert updated is not first
+        assert json.loads(updated)["state"] == "placing"
+
+    @pytest.mark.asyncio
+    async def test_game_info_json_nonexistent(self, service):
+        assert await service.get_game_info_json("nope") is None
+
 
 # ---------------------------------------------------------------------------
 # Session token authentication (#13)
@@ -203,11 +235,13 @@ class TestDisconnect:
         token2 = game.session_tokens[PlayerID.PLAYER2]
 
         await service.handle_player_disconnection(gid, PlayerID.PLAYER2)
+        await _flush(service)
         ws1.clear()
 
         ws2_new = MockWebSocket()
         await service.handle_player_connection(gid, ws2_new, token=token2)
 
+        await _flush(service)
         reconnected = ws1.find("player_reconnected")
         assert reconnected is not None
         assert reconnected["player_id"] == "player2"
@@ -221,11 +255,13 @@ class TestDisconnect:
         token1 = game.session_tokens[PlayerID.PLAYER1]
 
         await service.handle_player_disconnection(gid, PlayerID.PLAYER1)
+        await _flush(service)
         ws2.clear()
 
         ws1_new = MockWebSocket()
         await service.handle_player_connection(gid, ws1_new, token=token1)
 
+        await _flush(service)
         reconnected = ws2.find("player_reconnected")
         assert reconnected is not None
         assert reconnected["player_id"] == "player1"
@@ -240,6 +276,7 @@ class TestDisconnect:
         ws2 = MockWebSocket()
         await service.handle_player_connection(gid, ws2)
 
+        await _flush(service)
         assert ws1.find("player_reconnected") is None
 
     @pytest.mark.asyncio
@@ -251,11 +288,13 @@ class TestDisconnect:
         token1 = game.session_tokens[PlayerID.PLAYER1]
 
         await service.handle_player_disconnection(gid, PlayerID.PLAYER1)
+        await _flush(service)
         ws2.clear()
 
         ws1_new = MockWebSocket()
         await service.handle_player_connection(gid, ws1_new, token=token1)
 
+        await _flush(service)
         # Both players should get game_ready
         assert ws2.find("game_ready") is not None
 
@@ -328,8 +367,7 @@ class TestDisconnectRaceCondition:
         game = await service.get_game(gid)
         assert game.players[PlayerID.PLAYER2] is ws2_new
         # Connection manager should still have the new websocket
-        cm = service.connection_manager.active_connections.get(gid, {})
-        assert cm.get(PlayerID.PLAYER2) is ws2_new
+        assert service.connection_manager.get_websocket(gid, PlayerID.PLAYER2) is ws2_new
 
     @pytest.mark.asyncio
     async def test_current_disconnect_still_works(self, service):
@@ -365,15 +403,16 @@ class TestGameStateSerialization:
         ws = MockWebSocket()
         await service.handle_player_connection(gid, ws)
 
+        await _flush(service)
         msg = ws.find("player_assigned")
         assert msg["game_state"] == "waiting"
         assert type(msg["game_state"]) is str  # not GameState enum
 
     @pytest.mark.asyncio
     async def test_game_info_state_is_string(self, service):
-        """state in get_game_info must be a plain str, not an enum."""
+        """state in get_game_info_json must be a plain str, not an enum."""
         gid = await service.create_game()
-        info = await service.get_game_info(gid)
+        info = json.loads(await service.get_game_info_json(gid))
         assert info["state"] == "waiting"
         assert type(info["state"]) is str
 
@@ -385,6 +424,7 @@ class TestGameStateSerialization:
         await service.handle_player_connection(gid, ws1)
         await service.handle_player_connection(gid, ws2)
 
+        await _flush(service)
         msg = ws2.find("player_assigned")
         assert msg["game_state"] == "placing"
         assert type(msg["game_state"]) is str
@@ -406,6 +446,7 @@ async def _setup_elite_playing(service: GameService):
 
     game = await service.get_game(game_id)
     assert game.state == "playing"
+    await _flush(service)
     ws1.clear()
     ws2.clear()
     return game_id, ws1, ws2
@@ -419,7 +460,7 @@ class TestGameModeService:
         gid = await service.create_game(mode=GameMode.ELITE)
         game = await service.get_game(gid)
         assert game.mode == GameMode.ELITE
-        info = await service.get_game_info(gid)
+        info = json.loads(await service.get_game_info_json(gid))
         assert info["mode"] == "elite"
 
     @pytest.mark.asyncio
@@ -427,6 +468,7 @@ class TestGameModeService:
         gid = await service.create_game(mode=GameMode.ELITE)
         ws = MockWebSocket()
         await service.handle_player_connection(gid, ws)
+        await _flush(service)
         msg = ws.find("player_assigned")
         assert msg["mode"] == "elite"
         assert msg["max_planes"] == 3
@@ -435,6 +477,7 @@ class TestGameModeService:
     async def test_game_ready_message_reflects_mode(self, service):
         gid = await service.create_game(mode=GameMode.ELITE)
         ws1, ws2 = await _connect_two(service, gid)
+        await _flush(service)
         msg = ws1.find("game_ready")
         assert "3 planes each" in msg["message"]
 
@@ -469,6 +512,7 @@ class TestRematch:
     async def test_rematch_request_notifies_opponent(self, service):
         gid, ws1, ws2 = await _play_to_finish(service)
         await service.handle_rematch_request(gid, PlayerID.PLAYER1)
+        await _flush(service)
         assert ws2.find("rematch_requested") is not None
         assert ws1.find("rematch_requested") is None
 
@@ -476,9 +520,11 @@ class TestRematch:
     async def test_both_request_creates_new_game(self, service):
         gid, ws1, ws2 = await _play_to_finish(service)
         await service.handle_rematch_request(gid, PlayerID.PLAYER1)
+        await _flush(service)
         ws1.clear(); ws2.clear()
         await service.handle_rematch_request(gid, PlayerID.PLAYER2)
 
+        await _flush(service)
         msg1 = ws1.find("rematch_started")
         msg2 = ws2.find("rematch_started")
         assert msg1 is not None and msg2 is not None
@@ -504,10 +550,12 @@ class TestRematch:
         await service.handle_attack(gid, PlayerID.PLAYER1, 7, 0)
         await service.handle_attack(gid, PlayerID.PLAYER2, 5, 6)
         await service.handle_attack(gid, PlayerID.PLAYER1, 5, 9)
+        await _flush(service)
         ws1.clear(); ws2.clear()
 
         await service.handle_rematch_request(gid, PlayerID.PLAYER1)
         await service.handle_rematch_request(gid, PlayerID.PLAYER2)
+        await _flush(service)
         new_id = ws1.find("rematch_started")["game_id"]
         new_game = await service.get_game(new_id)
         assert new_game.mode == GameMode.ELITE
@@ -516,9 +564,11 @@ class TestRematch:
     async def test_duplicate_request_does_not_re_notify(self, service):
         gid, ws1, ws2 = await _play_to_finish(service)
         await service.handle_rematch_request(gid, PlayerID.PLAYER1)
+        await _flush(service)
         ws2.clear()
         await service.handle_rematch_request(gid, PlayerID.PLAYER1)
         # Second request should not send another notification
+        await _flush(service)
         assert ws2.find("rematch_requested") is None
 
     @pytest.mark.asyncio
@@ -526,9 +576,11 @@ class TestRematch:
         gid, ws1, ws2 = await _play_to_finish(service)
         await service.handle_rematch_request(gid, PlayerID.PLAYER1)
         await service.handle_rematch_request(gid, PlayerID.PLAYER2)
+        await _flush(service)
         ws1.clear()
         # Third request after game already created
         await service.handle_rematch_request(gid, PlayerID.PLAYER1)
+        await _flush(service)
         msg = ws1.find("rematch_started")
         assert msg is not None
 
@@ -536,6 +588,7 @@ class TestRematch:
     async def test_rematch_on_non_finished_game_ignored(self, service):
         gid, ws1, ws2 = await _setup_playing(service)
         await service.handle_rematch_request(gid, PlayerID.PLAYER1)
+        await _flush(service)
         assert ws1.find("rematch_requested") is None
         assert ws2.find("rematch_requested") is None
 
@@ -544,6 +597,7 @@ class TestRematch:
         gid, ws1, ws2 = await _play_to_finish(service)
         await service.handle_player_disconnection(gid, PlayerID.PLAYER2, ws2)
         await service.handle_rematch_request(gid, PlayerID.PLAYER1)
+        await _flush(service)
         msg = ws1.find("rematch_declined")
         assert msg is not None
         assert msg["reason"] == "opponent_disconnected"
@@ -553,8 +607,10 @@ class TestRematch:
         """Requester disconnects → opponent gets rematch_cancelled."""
         gid, ws1, ws2 = await _play_to_finish(service)
         await service.handle_rematch_request(gid, PlayerID.PLAYER1)
+        await _flush(service)
         ws2.clear()
         await service.handle_player_disconnection(gid, PlayerID.PLAYER1, ws1)
+        await _flush(service)
         assert ws2.find("rematch_cancelled") is not None
         game = await service.get_game(gid)
         assert game.rematch_requested_by is None
@@ -564,8 +620,10 @@ class TestRematch:
         """Non-requester disconnects → requester gets rematch_cancelled."""
         gid, ws1, ws2 = await _play_to_finish(service)
         await service.handle_rematch_request(gid, PlayerID.PLAYER1)
+        await _flush(service)
         ws1.clear()
         await service.handle_player_disconnection(gid, PlayerID.PLAYER2, ws2)
+        await _flush(service)
         assert ws1.find("rematch_cancelled") is not None
         game = await service.get_game(gid)
         assert game.rematch_requested_by is None
@@ -575,6 +633,7 @@ class TestRematch:
         """Disconnect from finished game with no rematch → no cancel message."""
         gid, ws1, ws2 = await _play_to_finish(service)
         await service.handle_player_disconnection(gid, PlayerID.PLAYER2, ws2)
+        await _flush(service)
         assert ws1.find("rematch_cancelled") is None
 
 
@@ -629,8 +688,10 @@ class TestPlacementStateGuard:
     @pytest.mark.asyncio
     async def test_placement_rejected_during_playing(self, service):
         gid, ws1, ws2 = await _setup_playing(service)
+        await _flush(service)
         ws1.clear()
         await service.handle_plane_placement(gid, PlayerID.PLAYER1, PLANE_1)
+        await _flush(service)
         err = ws1.find("error")
         assert err is not None
         assert "not in placement phase" in err["message"]
@@ -638,8 +699,10 @@ class TestPlacementStateGuard:
     @pytest.mark.asyncio
     async def test_placement_rejected_during_finished(self, service):
         gid, ws1, ws2 = await _play_to_finish(service)
+        await _flush(service)
         ws1.clear()
         await service.handle_plane_placement(gid, PlayerID.PLAYER1, PLANE_1)
+        await _flush(service)
         err = ws1.find("error")
         assert err is not None
         assert "not in placement phase" in err["message"]
@@ -649,8 +712,10 @@ class TestPlacementStateGuard:
         gid = await service.create_game()
         ws1 = MockWebSocket()
         await service.handle_player_connection(gid, ws1)
+        await _flush(service)
         ws1.clear()
         await service.handle_plane_placement(gid, PlayerID.PLAYER1, PLANE_1)
+        await _flush(service)
         err = ws1.find("error")
         assert err is not None
         assert "not in placement phase" in err["message"]
@@ -712,8 +777,10 @@ class TestFinishedDisconnectNotification:
     @pytest.mark.asyncio
     async def test_finished_disconnect_notifies_opponent(self, service):
         gid, ws1, ws2 = await _play_to_finish(service)
+        await _flush(service)
         ws1.clear()
         await service.handle_player_disconnection(gid, PlayerID.PLAYER2, ws2)
+        await _flush(service)
         msg = ws1.find("player_disconnected")
         assert msg is not None
         assert msg["player_id"] == "player2"
@@ -723,8 +790,10 @@ class TestFinishedDisconnectNotification:
         """Opponent should get both player_disconnected and rematch_cancelled."""
         gid, ws1, ws2 = await _play_to_finish(service)
         await service.handle_rematch_request(gid, PlayerID.PLAYER1)
+        await _flush(service)
         ws2.clear()
         await service.handle_player_disconnection(gid, PlayerID.PLAYER1, ws1)
+        await _flush(service)
         assert ws2.find("player_disconnected") is not None
         assert ws2.find("rematch_cancelled") is not None
 
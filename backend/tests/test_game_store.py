@@ -127,10 +127,19 @@ class TestSerialisation:
         data = GameStore._serialize(game)
         restored = GameStore._deserialize(data)
 
-        assert restored.boards[PlayerID.PLAYER2][0][2] == "head_hit"
+        assert restored.get_board(PlayerID.PLAYER2)[0][2] == "head_hit"
         destroyed = [p for p in restored.planes[PlayerID.PLAYER2] if p.is_destroyed]
         assert len(destroyed) == 1
 
+    def test_restored_game_detects_winner(self):
+        """Head and hit masks are rebuilt from the persisted hit positions."""
+        game = _make_playing_game()
+        for plane in game.planes[PlayerID.PLAYER2]:
+            game.attack(PlayerID.PLAYER1, *plane.head_position)
+
+        restored = GameStore._deserialize(json.loads(json.dumps(GameStore._serialize(game))))
+        assert restored.check_winner() == PlayerID.PLAYER1
+
     def test_json_round_trip(self):
         """Ensure the dict survives a full JSON encode/decode cycle."""
         game = _make_playing_game()
@@ -140,6 +149,28 @@ class TestSerialisation:
         assert restored.state == GameState.PLAYING
         assert len(restored.planes[PlayerID.PLAYER1]) == 2
 
+    def test_planes_json_round_trip_restores_types(self):
+        """Planes loaded from JSON get tuple coordinates and a working hit mask."""
+        game = _make_playing_game()
+        raw = json.dumps(GameStore._serialize(game))
+        restored = GameStore._deserialize(json.loads(raw))
+        plane = restored.planes[PlayerID.PLAYER2][0]
+
+        assert plane == game.planes[PlayerID.PLAYER2][0]
+        assert isinstance(plane.head_position, tuple)
+        assert isinstance(plane.orientation, PlaneOrientation)
+        assert plane.receive_attack(*plane.head_position) == "head_hit"
+
+    def test_restored_game_rejects_overlapping_placement(self):
+        """The occupancy mask is rebuilt from the restored planes."""
+        game = Game("overlap-game")
+        game.place_plane(PlayerID.PLAYER1, PLANE_1_DATA)
+        restored = GameStore._deserialize(json.loads(json.dumps(GameStore._serialize(game))))
+
+        success, message = restored.place_plane(PlayerID.PLAYER1, PLANE_1_DATA)
+        assert success is False
+        assert "overlap" in message.lower()
+
     def test_players_are_none_after_restore(self):
         game = _make_playing_game()
         data = GameStore._serialize(game)
@@ -170,11 +201,25 @@ class TestSerialisation:
         assert restored.finished_at == game.finished_at
         assert restored.finished_at is not None
 
+    def test_boards_persisted_as_cell_name_grids(self):
+        """Boards are stored as 10x10 grids of cell names, not raw bytes."""
+        game = Game("grid-game")
+        game.place_plane(PlayerID.PLAYER1, {"head_x": 5, "head_y": 2, "orientation": "up"})
+        data = json.loads(json.dumps(GameStore._serialize(game)))
+        grid = data["boards"]["player1"]
+        assert len(grid) == 10 and all(len(row) == 10 for row in grid)
+        assert grid[2][5] == "head"
+        assert grid[4][5] == "plane"
+        assert grid[0][0] == "empty"
+
     def test_deserialize_missing_new_fields(self):
         """Old data without session_tokens/timestamps should deserialise safely."""
         data = {
             "id": "old-game",
-            "boards": Game("x").boards,
+            "boards": {
+                pid: [["empty"] * 10 for _ in range(10)]
+                for pid in ("player1", "player2")
+            },
             "planes": {"player1": [], "player2": []},
             "state": "waiting",
             "current_turn": "player1",
@@ -309,8 +354,8 @@ class MockWebSocket:
     async def accept(self):
         self.accepted = True
 
-    async def send_json(self, data):
-        self.messages.append(data)
+    async def send_text(self, data):
+        self.messages.append(json.loads(data))
 
     async def close(self, code=1000):
         pass
@@ -342,6 +387,8 @@ class TestServicePersistence:
         loaded = await store.load(gid)
         assert len(loaded.planes[PlayerID.PLAYER1]) == 1
 
+        await service.shutdown()
+
     @pytest.mark.asyncio
     async def test_attack_persists(self):
         service, store = self._make_service()
@@ -356,9 +403,11 @@ class TestServicePersistence:
 
         await service.handle_attack(gid, PlayerID.PLAYER1, 5, 5)
         loaded = await store.load(gid)
-        assert loaded.boards[PlayerID.PLAYER2][5][5] == "miss"
+        assert loaded.get_board(PlayerID.PLAYER2)[5][5] == "miss"
         assert loaded.current_turn == PlayerID.PLAYER2
 
+        await service.shutdown()
+
     @pytest.mark.asyncio
     async def test_disconnect_persists(self):
         service, store = self._make_service()
@@ -371,6 +420,8 @@ class TestServicePersistence:
         loaded = await store.load(gid)
         assert loaded.players[PlayerID.PLAYER1] is None
 
+        await service.shutdown()
+
     @pytest.mark.asyncio
     async def test_restore_on_startup(self):
         """A new GameService should restore games from the store on initialize()."""
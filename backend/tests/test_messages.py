@@ -0,0 +1,27 @@
+"""
+Tests for the pre-encoded outbound messages.
+"""
+import json
+from application import messages
+from domain.value_objects import GameMode, PlayerID
+
+
+class TestStaticMessages:
+
+    def test_errors_are_encoded_error_frames(self):
+        assert json.loads(messages.NOT_YOUR_TURN) == {"type": "error", "message": "Not your turn"}
+        assert json.loads(messages.INVALID_ATTACK) == {"type": "error", "message": "Invalid attack"}
+
+    def test_game_ready_per_mode(self):
+        for mode in GameMode:
+            data = json.loads(messages.GAME_READY[mode])
+            assert data["type"] == "game_ready"
+            assert f"({mode.plane_count} planes each)" in data["message"]
+
+    def test_game_started_per_player(self):
+        for pid in PlayerID.both():
+            assert json.loads(messages.GAME_STARTED[pid]) == {
+                "type": "game_started", "current_turn": pid.value,
+            }
+        # Restored games hold the current turn as a plain string
+        assert messages.GAME_STARTED["player2"] is messages.GAME_STARTED[PlayerID.PLAYER2]
@@ -6,9 +6,11 @@ complete game to victory, disconnection/reconnection, and invalid messages.
 """
 import contextlib
 import json
+import typing
 import pytest
 from fastapi.testclient import TestClient
 import main as main_module
+from application.schemas import ClientMessage
 from main import app, game_service
 
 
@@ -21,13 +23,17 @@ def reset_state():
     """Reset all server state between tests."""
     game_service.games.clear()
     game_service._game_store._redis.store.clear()
-    game_service.connection_manager.active_connections.clear()
+    game_service.connection_manager.conns.clear()
+    game_service.connection_manager.per_game.clear()
     main_module._rate_limit_store.clear()
 
 
 @pytest.fixture
 def client():
-    return TestClient(app)
+    # Entered as a context manager so every WebSocket session shares one
+    # event loop, as they do under uvicorn (connection writers are loop-bound).
+    with TestClient(app) as c:
+        yield c
 
 
 @pytest.fixture
@@ -125,7 +131,7 @@ def _place_all_planes(ws1, ws2):
 
 
 def _do_attack(ws_attacker, ws_defender, x, y):
-    """Send an attack and consume the attack_result on both sockets.
+    """Send an attack and consume the attack_resolved broadcast on both sockets.
     Returns (attacker_msg, defender_msg)."""
     ws_attacker.send_json({"type": "attack", "x": x, "y": y})
     atk = ws_attacker.receive_json()
@@ -133,15 +139,6 @@ def _do_attack(ws_attacker, ws_defender, x, y):
     return atk, dfn
 
 
-def _consume_turn_changed(ws1, ws2):
-    """Consume the turn_changed broadcast on both sockets."""
-    tc1 = ws1.receive_json()
-    tc2 = ws2.receive_json()
-    assert tc1["type"] == "turn_changed"
-    assert tc2["type"] == "turn_changed"
-    return tc1, tc2
-
-
 # ---------------------------------------------------------------------------
 # Connection tests
 # ---------------------------------------------------------------------------
@@ -240,8 +237,10 @@ class TestAttack:
     def test_miss(self, playing_game):
         _, ws1, ws2 = playing_game
         atk, dfn = _do_attack(ws1, ws2, *EMPTY_CELL)
-        assert atk["result"] == "miss" and atk["is_attacker"] is True
-        assert dfn["result"] == "miss" and dfn["is_attacker"] is False
+        assert atk == dfn
+        assert atk["type"] == "attack_resolved"
+        assert atk["result"] == "miss" and atk["attacker"] == "player1"
+        assert atk["winner"] is None
 
     def test_body_hit(self, playing_game):
         _, ws1, ws2 = playing_game
@@ -256,10 +255,9 @@ class TestAttack:
 
     def test_turn_switches_after_attack(self, playing_game):
         _, ws1, ws2 = playing_game
-        _do_attack(ws1, ws2, *EMPTY_CELL)
-        tc1, tc2 = _consume_turn_changed(ws1, ws2)
-        assert tc1["current_turn"] == "player2"
-        assert tc2["current_turn"] == "player2"
+        atk, dfn = _do_attack(ws1, ws2, *EMPTY_CELL)
+        assert atk["next_turn"] == "player2"
+        assert dfn["next_turn"] == "player2"
 
     def test_attack_out_of_turn_rejected(self, playing_game):
         _, _, ws2 = playing_game
@@ -273,17 +271,15 @@ class TestAttack:
         _, ws1, ws2 = playing_game
         # P1 attacks (5,5) → miss
         _do_attack(ws1, ws2, *EMPTY_CELL)
-        _consume_turn_changed(ws1, ws2)
 
         # P2 attacks something → turn back to P1
         _do_attack(ws2, ws1, 5, 6)
-        _consume_turn_changed(ws1, ws2)
 
         # P1 attacks same cell again
         ws1.send_json({"type": "attack", "x": EMPTY_CELL[0], "y": EMPTY_CELL[1]})
         r = ws1.receive_json()
-        assert r["type"] == "attack_result"
-        assert r["success"] is False
+        assert r["type"] == "error"
+        assert r["message"] == "Invalid attack"
 
 
 # ---------------------------------------------------------------------------
@@ -298,43 +294,32 @@ class TestFullGame:
         # Turn 1 — P1 destroys P2's first cockpit
         atk, _ = _do_attack(ws1, ws2, *PLANE_1_HEAD)
         assert atk["result"] == "head_hit"
-        _consume_turn_changed(ws1, ws2)
 
         # Turn 2 — P2 misses
         _do_attack(ws2, ws1, *EMPTY_CELL)
-        _consume_turn_changed(ws1, ws2)
 
         # Turn 3 — P1 destroys P2's second cockpit → game over
-        atk, _ = _do_attack(ws1, ws2, *PLANE_2_HEAD)
-        assert atk["result"] == "head_hit"
-
-        go1 = ws1.receive_json()
-        go2 = ws2.receive_json()
-        assert go1["type"] == "game_over" and go1["winner"] == "player1"
-        assert go2["type"] == "game_over" and go2["winner"] == "player1"
+        go1, go2 = _do_attack(ws1, ws2, *PLANE_2_HEAD)
+        assert go1["result"] == "head_hit"
+        assert go1["winner"] == "player1"
+        assert go2["winner"] == "player1"
 
     def test_player2_can_also_win(self, playing_game):
         _, ws1, ws2 = playing_game
 
         # P1 misses
         _do_attack(ws1, ws2, *EMPTY_CELL)
-        _consume_turn_changed(ws1, ws2)
 
         # P2 destroys first cockpit
         _do_attack(ws2, ws1, *PLANE_1_HEAD)
-        _consume_turn_changed(ws1, ws2)
 
         # P1 misses again
         _do_attack(ws1, ws2, 5, 6)
-        _consume_turn_changed(ws1, ws2)
 
         # P2 destroys second cockpit → game over
-        _do_attack(ws2, ws1, *PLANE_2_HEAD)
-
-        go1 = ws1.receive_json()
-        go2 = ws2.receive_json()
-        assert go1["type"] == "game_over" and go1["winner"] == "player2"
-        assert go2["type"] == "game_over" and go2["winner"] == "player2"
+        go2, go1 = _do_attack(ws2, ws1, *PLANE_2_HEAD)
+        assert go1["winner"] == "player2"
+        assert go2["winner"] == "player2"
 
 
 # ---------------------------------------------------------------------------
@@ -344,33 +329,28 @@ class TestFullGame:
 class TestEndOfGameReveal:
 
     def test_game_over_reveals_opponent_boards(self, playing_game):
-        """Both players receive opponent's unmasked board in game_over."""
+        """The winning attack_resolved carries both unmasked boards."""
         _, ws1, ws2 = playing_game
 
         # P1 destroys P2's first cockpit
         _do_attack(ws1, ws2, *PLANE_1_HEAD)
-        _consume_turn_changed(ws1, ws2)
 
         # P2 misses
         _do_attack(ws2, ws1, *EMPTY_CELL)
-        _consume_turn_changed(ws1, ws2)
 
         # P1 destroys P2's second cockpit → game over
-        _do_attack(ws1, ws2, *PLANE_2_HEAD)
-
-        go1 = ws1.receive_json()
-        go2 = ws2.receive_json()
-        assert go1["type"] == "game_over"
-        assert go2["type"] == "game_over"
+        go1, go2 = _do_attack(ws1, ws2, *PLANE_2_HEAD)
+        assert go1["winner"] == "player1"
+        assert go1 == go2
 
         # Winner (P1) sees loser's (P2) unmasked board
-        board1 = go1["opponent_board"]
+        board1 = go1["boards"]["player2"]
         assert len(board1) == 10 and len(board1[0]) == 10
         flat1 = [cell for row in board1 for cell in row]
         assert "plane" in flat1 or "head" in flat1 or "head_hit" in flat1
 
         # Loser (P2) sees winner's (P1) unmasked board
-        board2 = go2["opponent_board"]
+        board2 = go2["boards"]["player1"]
         assert len(board2) == 10 and len(board2[0]) == 10
         flat2 = [cell for row in board2 for cell in row]
         assert "plane" in flat2 or "head" in flat2
@@ -390,12 +370,8 @@ class TestEndOfGameReveal:
 
             # Play to completion
             _do_attack(ws1, ws2, *PLANE_1_HEAD)
-            _consume_turn_changed(ws1, ws2)
             _do_attack(ws2, ws1, *EMPTY_CELL)
-            _consume_turn_changed(ws1, ws2)
             _do_attack(ws1, ws2, *PLANE_2_HEAD)
-            ws1.receive_json()  # game_over
-            ws2.receive_json()  # game_over
 
         # Both disconnected; any WebSocket connection should be rejected
         with pytest.raises(Exception):
@@ -608,7 +584,6 @@ class TestDisconnect:
 
                 # P1 hits P2's cockpit
                 _do_attack(ws1, ws2, *PLANE_1_HEAD)
-                _consume_turn_changed(ws1, ws2)
 
             # ws2 disconnected; ws1 still connected
             ws1.receive_json()  # player_disconnected
@@ -646,6 +621,13 @@ class TestInvalidMessages:
         err = ws1.receive_json()
         assert err["type"] == "error"
 
+    def test_every_client_message_type_has_a_handler(self):
+        types = {
+            model.model_fields["type"].annotation.__args__[0]
+            for model in typing.get_args(ClientMessage)
+        }
+        assert set(main_module._HANDLERS) == types
+
 
 # ---------------------------------------------------------------------------
 # Session token authentication — integration (#13)
@@ -726,6 +708,20 @@ class TestWebSocketMessageSize:
         r = ws1.receive_json()
         assert r["type"] == "plane_placed"
 
+    def test_binary_frame_accepted(self, two_player_game):
+        """Binary frames carrying JSON are parsed like text frames."""
+        _, ws1, _ = two_player_game
+        ws1.send_bytes(json.dumps(PLANE_1).encode())
+        r = ws1.receive_json()
+        assert r["type"] == "plane_placed"
+
+    def test_oversized_binary_frame_rejected(self, two_player_game):
+        _, ws1, _ = two_player_game
+        ws1.send_bytes(b"x" * 2000)
+        err = ws1.receive_json()
+        assert err["type"] == "error"
+        assert "too large" in err["message"].lower()
+
 
 # ---------------------------------------------------------------------------
 # WebSocket rate limiting (#14)
@@ -875,14 +871,9 @@ class TestSessionExpiredNotification:
 
         # Play to completion
         _do_attack(ws1, ws2, *PLANE_1_HEAD)
-        _consume_turn_changed(ws1, ws2)
         _do_attack(ws2, ws1, *EMPTY_CELL)
-        _consume_turn_changed(ws1, ws2)
         _do_attack(ws1, ws2, *PLANE_2_HEAD)  # game over
 
-        ws1.receive_json()  # game_over
-        ws2.receive_json()  # game_over
-
         # Connection attempt is rejected before accept (4010)
         with pytest.raises(Exception):
             with client.websocket_connect(f"/ws/{game_id}") as ws_bad:
@@ -916,12 +907,8 @@ class TestGameInfoHardening:
         game_id, ws1, ws2 = playing_game
 
         _do_attack(ws1, ws2, *PLANE_1_HEAD)
-        _consume_turn_changed(ws1, ws2)
         _do_attack(ws2, ws1, *EMPTY_CELL)
-        _consume_turn_changed(ws1, ws2)
         _do_attack(ws1, ws2, *PLANE_2_HEAD)
-        ws1.receive_json()  # game_over
-        ws2.receive_json()  # game_over
 
         response = client.get(f"/api/game/{game_id}")
         data = response.json()
@@ -1025,24 +1012,16 @@ class TestEliteModeFullGame:
 
                 # P1 destroys P2's 1st cockpit
                 _do_attack(ws1, ws2, *PLANE_1_HEAD)
-                _consume_turn_changed(ws1, ws2)
                 # P2 misses
                 _do_attack(ws2, ws1, *EMPTY_CELL)
-                _consume_turn_changed(ws1, ws2)
                 # P1 destroys P2's 2nd cockpit
                 _do_attack(ws1, ws2, *PLANE_2_HEAD)
-                _consume_turn_changed(ws1, ws2)
                 # P2 misses
                 _do_attack(ws2, ws1, 0, 9)
-                _consume_turn_changed(ws1, ws2)
                 # P1 destroys P2's 3rd cockpit → game over
-                atk, dfn = _do_attack(ws1, ws2, *PLANE_3_HEAD)
-
-                go1 = ws1.receive_json()
-                go2 = ws2.receive_json()
-                assert go1["type"] == "game_over"
+                go1, go2 = _do_attack(ws1, ws2, *PLANE_3_HEAD)
+                assert go1["type"] == "attack_resolved"
                 assert go1["winner"] == "player1"
-                assert go2["type"] == "game_over"
                 assert go2["winner"] == "player1"
 
     def test_3rd_plane_rejected_in_classic_mode(self, client):
@@ -11,9 +11,7 @@ export type ServerMessage =
   | { type: 'game_ready'; message: string }
   | { type: 'plane_placed'; success: boolean; message: string; planes_count: number }
   | { type: 'game_started'; current_turn: string }
-  | { type: 'attack_result'; x: number; y: number; result: string; is_attacker: boolean }
-  | { type: 'turn_changed'; current_turn: string }
-  | { type: 'game_over'; winner: string; opponent_board: CellStatus[][] }
+  | { type: 'attack_resolved'; x: number; y: number; result: string; attacker: string; next_turn: string; winner: string | null; boards?: Record<PlayerID, CellStatus[][]> }
   | { type: 'game_resumed'; own_board: CellStatus[][]; opponent_board: CellStatus[][]; current_turn: string; game_state?: string; winner?: string | null; planes_placed?: number }
   | { type: 'player_disconnected' }
   | { type: 'player_reconnected'; player_id: string }
@@ -1,4 +1,4 @@
-import { CellStatus, ServerMessage, PLAYER1 } from '../hooks/UseGameWebSocket';
+import { CellStatus, ServerMessage, PLAYER1, PLAYER2 } from '../hooks/UseGameWebSocket';
 
 // Helper to convert numeric coordinates to proper labels (e.g., x=3, y=2 -> "C4")
 // In the grid: board[y][x], where y is row index (A-J) and x is column index (1-10)
@@ -96,8 +96,9 @@ export function gameReducer(
         message: 'Game started! Destroy enemy cockpits to win!',
       };
 
-    case 'attack_result': {
-      const boardKey = action.is_attacker
+    case 'attack_resolved': {
+      const isAttacker = action.attacker === state.playerId;
+      const boardKey = isAttacker
         ? 'opponentBoard'
         : 'ownBoard';
 
@@ -106,7 +107,7 @@ export function gameReducer(
 
       let message = '';
       const coordLabel = getCoordinateLabel(action.x, action.y);
-      if (action.is_attacker) {
+      if (isAttacker) {
         if (action.result === 'head_hit') {
           message = `💥 COCKPIT HIT! Enemy plane destroyed at ${coordLabel}!`;
         } else if (action.result === 'hit') {
@@ -124,28 +125,27 @@ export function gameReducer(
         }
       }
 
+      if (action.winner) {
+        const opponent = state.playerId === PLAYER1 ? PLAYER2 : PLAYER1;
+        return {
+          ...state,
+          [boardKey]: newBoard,
+          gameState: 'finished',
+          currentTurn: action.next_turn,
+          winner: action.winner,
+          opponentBoard: action.boards?.[opponent] ?? (isAttacker ? newBoard : state.opponentBoard),
+          message: `Game Over! Winner: ${action.winner}`,
+        } as GameUIState;
+      }
+
       return {
         ...state,
         [boardKey]: newBoard,
+        currentTurn: action.next_turn,
         message,
       } as GameUIState;
     }
 
-    case 'turn_changed':
-      return {
-        ...state,
-        currentTurn: action.current_turn,
-      };
-
-    case 'game_over':
-      return {
-        ...state,
-        gameState: 'finished',
-        winner: action.winner,
-        opponentBoard: action.opponent_board,
-        message: `Game Over! Winner: ${action.winner}`,
-      };
-
     case 'game_resumed':
       return {
         ...state,
@@ -277,18 +277,21 @@ describe('gameReducer - waitingForOpponent', () => {
 
 });
 
-describe('gameReducer - game_over', () => {
+describe('gameReducer - attack_resolved', () => {
 
-  it('should set opponentBoard from game_over message', () => {
+  it('should set opponentBoard from the revealed boards when there is a winner', () => {
     const opponentBoard = createEmptyBoard();
     opponentBoard[0][2] = 'head_hit' as CellStatus;
     opponentBoard[1][0] = 'plane' as CellStatus;
 
     const playingState = { ...baseState, gameState: 'playing' as const };
     const action: ServerMessage = {
-      type: 'game_over',
+      type: 'attack_resolved',
+      x: 2, y: 0, result: 'head_hit',
+      attacker: 'player1',
+      next_turn: 'player1',
       winner: 'player1',
-      opponent_board: opponentBoard,
+      boards: { player1: createEmptyBoard(), player2: opponentBoard },
     };
     const state = gameReducer(playingState, action);
     expect(state.gameState).toBe('finished');
@@ -296,6 +299,18 @@ describe('gameReducer - game_over', () => {
     expect(state.opponentBoard[0][2]).toBe('head_hit');
     expect(state.opponentBoard[1][0]).toBe('plane');
   });
+
+  it('should mark own board when the opponent is the attacker', () => {
+    const playingState = { ...baseState, gameState: 'playing' as const, currentTurn: 'player2' };
+    const state = gameReducer(playingState, {
+      type: 'attack_resolved', x: 4, y: 6, result: 'miss',
+      attacker: 'player2', next_turn: 'player1', winner: null,
+    } as ServerMessage);
+    expect(state.ownBoard[6][4]).toBe('miss');
+    expect(state.opponentBoard[6][4]).toBe('empty');
+    expect(state.currentTurn).toBe('player1');
+    expect(state.gameState).toBe('playing');
+  });
 });
 
 // ── Message sequence tests ──────────────────────────────────────────
@@ -373,7 +388,7 @@ describe('gameReducer - message sequences', () => {
 
   // ── Normal game lifecycle ──────────────────────────────────────
 
-  it('full normal game lifecycle: assigned → ready → placed → started → attack → game_over', () => {
+  it('full normal game lifecycle: assigned → ready → placed → started → attack → attack_resolved with winner', () => {
     let s = gameReducer(initialGameState, {
       type: 'player_assigned', player_id: 'player1', game_state: 'waiting',
     } as ServerMessage);
@@ -399,40 +414,44 @@ describe('gameReducer - message sequences', () => {
     expect(s.currentTurn).toBe('player1');
 
     s = gameReducer(s, {
-      type: 'attack_result', x: 3, y: 2, result: 'miss', is_attacker: true,
+      type: 'attack_resolved', x: 3, y: 2, result: 'miss',
+      attacker: 'player1', next_turn: 'player2', winner: null,
     } as ServerMessage);
     expect(s.opponentBoard[2][3]).toBe('miss');
-
-    s = gameReducer(s, { type: 'turn_changed', current_turn: 'player2' } as ServerMessage);
     expect(s.currentTurn).toBe('player2');
 
     s = gameReducer(s, {
-      type: 'attack_result', x: 1, y: 1, result: 'hit', is_attacker: false,
+      type: 'attack_resolved', x: 1, y: 1, result: 'hit',
+      attacker: 'player2', next_turn: 'player1', winner: null,
     } as ServerMessage);
     expect(s.ownBoard[1][1]).toBe('hit');
+    expect(s.currentTurn).toBe('player1');
 
     const finalBoard = createEmptyBoard();
     finalBoard[0][0] = 'head_hit' as CellStatus;
     s = gameReducer(s, {
-      type: 'game_over', winner: 'player1', opponent_board: finalBoard,
+      type: 'attack_resolved', x: 0, y: 0, result: 'head_hit',
+      attacker: 'player1', next_turn: 'player1', winner: 'player1',
+      boards: { player1: s.ownBoard, player2: finalBoard },
     } as ServerMessage);
     expect(s.gameState).toBe('finished');
     expect(s.winner).toBe('player1');
     expect(s.opponentBoard[0][0]).toBe('head_hit');
   });
 
-  // ── Stale attack_result after game_over ────────────────────────
+  // ── Stale attack_resolved after game over ──────────────────────
 
-  it('attack_result after game_over still applies to board without crashing', () => {
+  it('attack_resolved after game over still applies to board without crashing', () => {
     const finished: GameUIState = {
       ...baseState,
       gameState: 'finished',
       winner: 'player1',
     };
 
-    // A stale attack_result arriving after game_over should not throw
+    // A stale attack_resolved arriving after game over should not throw
     const s = gameReducer(finished, {
-      type: 'attack_result', x: 0, y: 0, result: 'hit', is_attacker: true,
+      type: 'attack_resolved', x: 0, y: 0, result: 'hit',
+      attacker: 'player1', next_turn: 'player2', winner: null,
     } as ServerMessage);
     expect(s.gameState).toBe('finished');  // unchanged
     expect(s.opponentBoard[0][0]).toBe('hit');  // applied but harmless